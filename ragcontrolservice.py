@@ -6,6 +6,12 @@
 import os
 os.environ.setdefault("ONNXRUNTIME_PROVIDER_LIST", "CPUExecutionProvider")
 
+# Pin BLAS/OpenMP thread pools to the physical core count before any of the
+# numeric libraries are imported; the defaults can leave CPU inference either
+# single-threaded or oversubscribed.
+os.environ.setdefault("OMP_NUM_THREADS", str(os.cpu_count() or 1))
+os.environ.setdefault("MKL_NUM_THREADS", str(os.cpu_count() or 1))
+
 """
 ================================================================================
 RAG Control Service (Pluggable Embeddings)
@@ -55,9 +61,20 @@ LAST UPDATED: 2025-08-14
 # Standard library imports
 # ------------------------------------------------------------------------------
 import sys
+import atexit
+import queue
 import logging
+import logging.handlers
 import hashlib
+import mmap
+import collections
+import threading
+import time
+import sqlite3
+import functools
+import concurrent.futures
 from typing import List, Dict, Optional, Any
+from dataclasses import dataclass
 from pathlib import Path
 import re
 from datetime import datetime
@@ -68,20 +85,157 @@ load_dotenv()  # will read .env from current directory by default
 # ------------------------------------------------------------------------------
 # Third-party imports
 # ------------------------------------------------------------------------------
+import numpy as np
 import pdfplumber
 import chromadb
+
+# Optional fast PDF backend: pypdfium2 wraps the PDFium C++ core and skips
+# the full layout model pdfplumber builds just to extract plain text.
+try:
+    import pypdfium2 as pdfium
+except ImportError:
+    pdfium = None
 from chromadb.config import Settings
 from chromadb.utils import embedding_functions
 
+# Configure torch intra-op parallelism for CPU embedding. Guarded: torch is
+# absent in pure-ONNX setups, and interop threads can only be set once.
+try:
+    import torch
+    torch.set_num_threads(os.cpu_count() or 1)
+    torch.set_num_interop_threads(2)
+except Exception:
+    pass
+
 # ------------------------------------------------------------------------------
 # Supported Embeddings & Factory
 # ------------------------------------------------------------------------------
 SUPPORTED_EMBEDDINGS = ("Sentence-Transformers", "OpenAIEmbeddings")
 
 
+# Minimum page count before we pay the cost of spinning up worker processes.
+_PDF_PARALLEL_MIN_PAGES = 4
+
+# Chunks embedded and inserted per collection.add call during ingest; caps
+# peak memory at one batch of texts + vectors regardless of document size.
+_INGEST_BATCH_SIZE = 128
+
+# IDs removed per collection.delete call; bounds the SQLite transaction size
+# so huge documents delete with predictable latency instead of one giant op.
+_DELETE_BATCH = 500
+
+# Rows fetched per page when a full metadata scan is unavoidable; bounds the
+# peak memory of the scan to one page instead of the whole collection.
+_SCAN_PAGE = 10000
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_abspath(path: str, cwd: str) -> str:
+    """
+    os.path.abspath against a precomputed cwd. The stock abspath calls
+    os.getcwd() — a syscall — on every invocation; callers pass the cwd
+    cached at service construction, which also makes repeat paths in
+    bulk-delete loops a memoized dict hit.
+    """
+    if os.path.isabs(path):
+        return os.path.normpath(path)
+    return os.path.normpath(os.path.join(cwd, path))
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_basename(path: str) -> str:
+    """Memoized os.path.basename for repeat-path call patterns."""
+    return os.path.basename(path)
+
+# Whitespace normalization: the regex is compiled once at import; for ASCII
+# text we instead map control whitespace to spaces and let str.split/join
+# (both C-level) collapse runs, which is several times faster than re.sub.
+_WS_RE = re.compile(r"\s+")
+_WS_TABLE = str.maketrans({c: " " for c in "\t\n\r\x0b\x0c"})
+
+# Collection-name sanitizer, compiled once at import.
+_SAFE_RE = re.compile(r"[^A-Za-z0-9_]+")
+
+
+@dataclass
+class _ChromaResult:
+    """
+    Validated shape of a Chroma get() response. Every consumer used to
+    re-check isinstance/key-presence inline; centralizing the guards here
+    keeps the hot paths branch-light and the failure handling uniform.
+    """
+
+    __slots__ = ("ids", "metadatas", "documents")
+
+    ids: List[str]
+    metadatas: List[Dict[str, Any]]
+    documents: List[str]
+
+    @classmethod
+    def from_raw(cls, raw: Any) -> Optional["_ChromaResult"]:
+        """Validate a raw response once; returns None if the shape is off."""
+        if not raw or not isinstance(raw, dict):
+            return None
+        ids = raw.get("ids")
+        if not isinstance(ids, list):
+            return None
+        metadatas = raw.get("metadatas")
+        documents = raw.get("documents")
+        return cls(
+            ids=ids,
+            metadatas=metadatas if isinstance(metadatas, list) else [],
+            documents=documents if isinstance(documents, list) else [],
+        )
+
+
+def _normalize_whitespace(text: str) -> str:
+    """Collapse all whitespace runs to single spaces and strip the ends."""
+    if text.isascii():
+        return " ".join(text.translate(_WS_TABLE).split())
+    # Unicode whitespace (NBSP etc.) still needs the regex path.
+    return _WS_RE.sub(" ", text.strip())
+
+
+# Sentence-boundary characters used when choosing chunk break points.
+_BREAK_BYTES = np.frombuffer(b".!?\n", dtype=np.uint8)
+
+
+def _find_break_positions(text: str) -> Optional[np.ndarray]:
+    """
+    Precompute the sorted positions of all sentence-boundary characters in
+    `text` as a NumPy index array, so the chunking loop can find the last
+    boundary in a window with one binary search instead of four rfind scans.
+
+    Returns None for non-ASCII text, where byte offsets would not line up
+    with character offsets; callers fall back to per-window rfind.
+    """
+    if not text.isascii():
+        return None
+    arr = np.frombuffer(text.encode("ascii"), dtype=np.uint8)
+    return np.flatnonzero(np.isin(arr, _BREAK_BYTES))
+
+
+def _extract_pdf_page_text(args) -> tuple:
+    """
+    Worker for parallel PDF extraction (must be module-level for pickling).
+
+    Opens the PDF restricted to a single page and returns (page_number, text).
+    pdfminer is pure Python and CPU-bound, so per-page subprocesses scale
+    near-linearly with core count on large PDFs.
+    """
+    file_path, page_number = args
+    try:
+        with pdfplumber.open(file_path, pages=[page_number]) as pdf:
+            page_text = pdf.pages[0].extract_text()
+        return page_number, page_text or ""
+    except Exception:
+        # Page-level failures are tolerated; caller logs and skips.
+        return page_number, ""
+
+
 def _safe_collection_suffix(name: str) -> str:
     """Sanitize a name to be safe in a Chroma collection suffix."""
-    return re.sub(r'[^A-Za-z0-9_]+', '_', name.strip().replace(' ', '_'))
+    return _SAFE_RE.sub('_', name.strip().replace(' ', '_'))
 
 
 def build_embedding_function(
@@ -90,17 +244,43 @@ def build_embedding_function(
     sentence_model_name: str = "all-MiniLM-L6-v2",
     openai_api_key: Optional[str] = None,
     openai_model_name: str = "text-embedding-3-small",
+    sentence_fp16: bool = False,
 ):
     """
     Build and return a Chroma embedding function for the requested method.
 
+    `sentence_fp16` halves the Sentence-Transformers model weights when a
+    CUDA device is available (FP16 roughly doubles GPU throughput for
+    MiniLM with negligible retrieval-accuracy loss); it is ignored on CPU,
+    where torch FP16 kernels are slower than FP32.
+
     Extend by adding new `elif` branches for additional providers.
     """
     if embedding_method == "Sentence-Transformers":
         # Local, fast, 384-dim, no API key required.
-        return embedding_functions.SentenceTransformerEmbeddingFunction(
+        if sentence_model_name == "all-MiniLM-L6-v2" and not sentence_fp16:
+            # Prefer Chroma's ONNX Runtime export of MiniLM: identical
+            # vectors, roughly 4x faster on CPU than the PyTorch path, and
+            # it honours the CPUExecutionProvider forced at the top of this
+            # file. Fall back to the torch path if onnxruntime is missing.
+            try:
+                return embedding_functions.ONNXMiniLM_L6_V2(
+                    preferred_providers=["CPUExecutionProvider"]
+                )
+            except Exception:
+                pass
+        ef = embedding_functions.SentenceTransformerEmbeddingFunction(
             model_name=sentence_model_name
         )
+        if sentence_fp16:
+            try:
+                if torch.cuda.is_available():
+                    ef._model.half()
+            except Exception:
+                # No torch/CUDA, or the wrapped model is not exposed; FP32
+                # embedding still works, so never fail initialization here.
+                pass
+        return ef
 
     elif embedding_method == "OpenAIEmbeddings":
         # Requires OpenAI API key; reads from parameter or env var.
@@ -138,11 +318,16 @@ class RAGControlService:
         # Optional model overrides:
         sentence_model_name: str = "all-MiniLM-L6-v2",
         openai_model_name: str = "text-embedding-3-small",
+        sentence_fp16: bool = False,
         # Optional API keys:
         openai_api_key: Optional[str] = None,
         # Chroma settings:
         anonymized_telemetry: bool = False,
         allow_reset: bool = True,
+        # Write behaviour:
+        async_writes: bool = False,
+        # Embedding batch override (None picks a method-aware default):
+        embed_batch_size: Optional[int] = None,
     ):
         """
         Initialize RAGControlService with ChromaDB connection and logging setup.
@@ -152,9 +337,18 @@ class RAGControlService:
             embedding_method: One of SUPPORTED_EMBEDDINGS.
             sentence_model_name: Model for Sentence-Transformers.
             openai_model_name: Model for OpenAI embeddings.
+            sentence_fp16: Run the Sentence-Transformers model in FP16
+                (applied only when a CUDA device is available).
             openai_api_key: OpenAI key (if using OpenAIEmbeddings).
             anonymized_telemetry: Chroma telemetry flag.
             allow_reset: Allow Chroma reset operations.
+            async_writes: Queue collection writes on a background executor;
+                study_document then returns immediately with status
+                "queued" and callers use flush() to wait for durability.
+            embed_batch_size: Texts per embedding call during ingest;
+                defaults to 64 for local transformers and 2048 for the
+                OpenAI endpoint. Raise it on GPU hosts where the model
+                is nowhere near saturated at 64.
         """
         self.db_path = db_path
         self.embedding_method = embedding_method
@@ -183,6 +377,34 @@ class RAGControlService:
                 sentence_model_name=self.sentence_model_name,
                 openai_api_key=openai_api_key,
                 openai_model_name=self.openai_model_name,
+                sentence_fp16=sentence_fp16,
+            )
+
+            # Keep a handle on the embedding function so ingest can batch
+            # embeddings itself instead of letting Chroma embed one shot.
+            # Local transformers saturate around 64 texts per forward pass,
+            # while the OpenAI endpoint accepts up to 2048 inputs per
+            # request — larger batches there amortize the API round-trip.
+            self._embedding_fn = ef
+            if embed_batch_size is not None and embed_batch_size > 0:
+                self._embed_batch_size = embed_batch_size
+            else:
+                self._embed_batch_size = (
+                    2048 if self.embedding_method == "OpenAIEmbeddings" else 64
+                )
+            # Chunks per collection.add call: OpenAI tolerates larger groups
+            # because the API round-trip dominates, while the local path
+            # keeps the default to bound peak text+vector memory.
+            self._ingest_batch_size = (
+                512 if self.embedding_method == "OpenAIEmbeddings" else _INGEST_BATCH_SIZE
+            )
+
+            # Query-embedding cache: unlike the result cache below, an
+            # embedding for a given query string never changes, so entries
+            # survive collection mutations. A hit skips one full model
+            # inference (or one OpenAI round-trip) per repeated query.
+            self._query_embedding = functools.lru_cache(maxsize=1024)(
+                lambda q: tuple(ef([q])[0])
             )
 
             # Use a per-embedding-method collection to prevent vector size collisions
@@ -195,10 +417,89 @@ class RAGControlService:
                     "embedding_method": self.embedding_method,
                     "sentence_model_name": self.sentence_model_name,
                     "openai_model_name": self.openai_model_name,
+                    # HNSW tuning (applied when the collection is first
+                    # created): cosine matches the embedding models, and the
+                    # larger M / construction_ef trade slower one-off ingest
+                    # for lower query latency at the same recall — the right
+                    # trade for a read-heavy RAG workload.
+                    "hnsw:space": "cosine",
+                    "hnsw:construction_ef": 200,
+                    "hnsw:M": 32,
+                    "hnsw:search_ef": 64,
                 },
                 embedding_function=ef,
             )
 
+            # In-process LRU cache for search results: repeated identical
+            # queries are common in RAG workloads, and a hit skips both the
+            # query embedding and the HNSW traversal. Invalidated whenever
+            # the collection is mutated (study/delete).
+            self._query_cache: collections.OrderedDict = collections.OrderedDict()
+            self._query_cache_lock = threading.RLock()
+            self._query_cache_max_size = 2000
+            self._query_cache_ttl_seconds = 600.0
+
+            # Background writer: Chroma's SQLite writes are the dominant
+            # bottleneck at scale, so optionally queue them off-thread and
+            # let CPU-bound embedding of the next document proceed.
+            self.async_writes = async_writes
+            self._writer = concurrent.futures.ThreadPoolExecutor(
+                max_workers=2, thread_name_prefix="rag-writer"
+            )
+            self._pending_writes: List[concurrent.futures.Future] = []
+            self._pending_writes_lock = threading.Lock()
+            # Serializes collection writes and the bookkeeping that follows
+            # them, so concurrent ingests (study_documents, async writer)
+            # never interleave inside Chroma's SQLite transaction.
+            self._collection_write_lock = threading.Lock()
+
+            # Ingest manifest: persists file_path -> (document_id, mtime,
+            # size) across runs so re-ingesting an unchanged file can be
+            # skipped before the file is even opened.
+            self._manifest_path = os.path.join(self.db_path, "manifest.json")
+            self._manifest = self._load_manifest()
+            # Serializes manifest mutation + save: study_documents runs
+            # ingests on several threads and each records its entry here.
+            self._manifest_lock = threading.Lock()
+
+            # Per-document chunk/char counters, persisted as a sidecar so
+            # document-level stats never need a full metadata scan. None
+            # means "unknown" (pre-existing collection without a sidecar);
+            # the first stats scan rebuilds it.
+            self._doc_counts_path = os.path.join(self.db_path, "_doc_counts.json")
+            self._doc_chunk_counts = self._load_doc_counts()
+
+            # Inverted path index: file_path -> chunk ids, persisted in a
+            # small SQLite sidecar so delete-by-path resolves in
+            # O(matched_chunks) without ever scanning collection metadata.
+            # Best-effort: if it cannot be opened, delete paths fall back to
+            # the metadata lookups below.
+            self._path_index_path = os.path.join(self.db_path, "path_index.sqlite")
+            self._path_index_lock = threading.Lock()
+            self._path_index = self._open_path_index()
+
+            # Stats cache, keyed by a collection version that every mutation
+            # bumps: polling callers (dashboards, CLIs) hit an unchanged
+            # collection most of the time and should not pay a full scan.
+            self._collection_version = 0
+            self._stats_cache: Optional[tuple] = None
+            # Document-list cache, same versioning scheme: list_documents
+            # pulls every chunk's metadata just to dedupe by document_id,
+            # so repeated listings of an unchanged collection are free.
+            self._doc_list_cache: Optional[tuple] = None
+            # Single-flight guard: concurrent stats callers share one scan.
+            self._stats_lock = threading.Lock()
+            self._stats_inflight: Optional[concurrent.futures.Future] = None
+
+            # Working directory, cached once so path normalization in the
+            # delete paths avoids a getcwd() syscall per call.
+            self._cwd = os.getcwd()
+
+            # Known document IDs, loaded lazily with one metadata scan so
+            # existence checks become O(1) set lookups instead of a Chroma
+            # round-trip per study_document call.
+            self._known_doc_ids: Optional[set] = None
+
             self.logger.info(
                 f"RAGControlService initialized at '{self.db_path}' "
                 f"using collection '{self.collection_name}' "
@@ -213,36 +514,113 @@ class RAGControlService:
     # Logging
     # --------------------------------------------------------------------------
     def setup_logging(self):
-        """Setup comprehensive logging configuration for the entire system."""
+        """
+        Setup comprehensive logging configuration for the entire system.
+
+        Records are funneled through a QueueHandler to a background
+        QueueListener that owns the file/stream handlers, so hot paths
+        (chunking, search, ingest) never block on disk or terminal I/O.
+
+        Idempotent: one queue, listener, and log file per process, no
+        matter how many service instances are constructed.
+        """
+        root = logging.getLogger()
+        if getattr(root, "_ragservice_configured", False):
+            return
+
+        log_queue: queue.Queue = queue.Queue(-1)
+
+        formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+        # delay=True: the log file is opened on first emit, so constructing
+        # the service for a read-only command never touches the disk.
+        file_handler = logging.FileHandler("rag_system.log", delay=True)
+        file_handler.setFormatter(formatter)
+        stream_handler = logging.StreamHandler(sys.stdout)
+        stream_handler.setFormatter(formatter)
+
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, stream_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
+        atexit.register(self._log_listener.stop)
+
         logging.basicConfig(
             level=logging.INFO,
-            format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-            handlers=[
-                logging.FileHandler("rag_system.log"),
-                logging.StreamHandler(sys.stdout),
-            ],
+            handlers=[logging.handlers.QueueHandler(log_queue)],
         )
+        root._ragservice_configured = True
 
     # --------------------------------------------------------------------------
     # Utility: IDs & File IO
     # --------------------------------------------------------------------------
+    def _hash_file_content(self, file_path: str) -> str:
+        """
+        Return a BLAKE2b hex digest of the file's content.
+
+        Files under 1 MiB are read in one shot; larger files are hashed
+        through mmap so we never hold a full in-memory copy. BLAKE2b is
+        also considerably faster than MD5 in hashlib.
+        """
+        try:
+            if hasattr(hashlib, "file_digest"):
+                # Python 3.11+: C-level read loop with buffer sizing and GIL
+                # release handled internally — faster than hand-rolled I/O.
+                with open(file_path, "rb") as f:
+                    return hashlib.file_digest(
+                        f, lambda: hashlib.blake2b(digest_size=16)
+                    ).hexdigest()
+
+            size = os.path.getsize(file_path)
+            h = hashlib.blake2b(digest_size=16)
+            with open(file_path, "rb") as f:
+                if size < 1 << 20:
+                    h.update(f.read())
+                else:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        h.update(mm)
+            return h.hexdigest()
+        except Exception as e:
+            self.logger.error(f"Failed to hash file content for {file_path}: {str(e)}")
+            raise
+
     def _generate_document_id(self, file_path: str) -> str:
-        """Generate a unique document ID based on absolute file path hash."""
+        """
+        Generate a unique document ID from the file's *content* hash.
+
+        Content addressing means two copies of the same file at different
+        paths share one ID, so the second copy is never re-embedded.
+        """
         try:
             file_path = os.path.abspath(file_path)
-            file_hash = hashlib.md5(file_path.encode()).hexdigest()
-            return f"doc_{file_hash}"
+            return f"doc_{self._hash_file_content(file_path)}"
         except Exception as e:
             self.logger.error(f"Failed to generate document ID for {file_path}: {str(e)}")
             raise
 
     def _read_markdown_file(self, file_path: str) -> str:
-        """Read and return markdown file content."""
+        """
+        Read and return markdown file content.
+
+        Files over 1 MiB are read through mmap so the raw bytes are paged in
+        by the kernel rather than buffered twice (file buffer + str), which
+        roughly halves peak memory while ingesting large documents.
+        """
         try:
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"Markdown file not found: {file_path}")
-            with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+            try:
+                size = os.path.getsize(file_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"Markdown file not found: {file_path}") from None
+
+            if size < 1 << 20:
+                # 256 KiB buffer: the whole read costs a handful of
+                # syscalls instead of one per 8 KiB default block.
+                with open(file_path, "r", encoding="utf-8", buffering=1 << 18) as f:
+                    content = f.read()
+            else:
+                with open(file_path, "rb") as f:
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        content = mm[:].decode("utf-8")
+
             self.logger.info(f"Successfully read markdown file: {file_path}")
             return content
         except UnicodeDecodeError as e:
@@ -252,24 +630,66 @@ class RAGControlService:
             self.logger.error(f"Failed to read markdown file {file_path}: {str(e)}")
             raise
 
-    def _read_pdf_file(self, file_path: str) -> str:
-        """Read and return extracted text from PDF using pdfplumber."""
+    def _read_pdf_fast(self, file_path: str) -> str:
+        """
+        Extract text-only content via pypdfium2 (PDFium C++ core).
+
+        5-20x faster than pdfplumber for plain text because no chars/lines
+        layout model is built. Output keeps the same page separators as the
+        pdfplumber path so chunking and metadata are unaffected.
+        """
+        pdf = pdfium.PdfDocument(file_path)
+        try:
+            parts: List[str] = []
+            for page_num in range(len(pdf)):
+                page_text = pdf[page_num].get_textpage().get_text_range()
+                if page_text:
+                    parts.append(f"\n--- Page {page_num + 1} ---\n{page_text}\n")
+            return "".join(parts)
+        finally:
+            pdf.close()
+
+    def _read_pdf_file(self, file_path: str, fast: bool = True) -> str:
+        """
+        Read and return extracted text from PDF.
+
+        When `fast` is set and pypdfium2 is installed, text is pulled
+        straight from PDFium; pdfplumber remains the fallback for malformed
+        PDFs or text-less extractions. On the pdfplumber path, large PDFs
+        fan out per-page extraction across a process pool (pdfminer is
+        CPU-bound pure Python, so threads would not help); small PDFs keep
+        the serial path to avoid process-spawn overhead.
+        """
         try:
             if not os.path.exists(file_path):
                 raise FileNotFoundError(f"PDF file not found: {file_path}")
 
-            content = ""
+            if fast and pdfium is not None:
+                try:
+                    content = self._read_pdf_fast(file_path)
+                    if content.strip():
+                        self.logger.info(f"Successfully read PDF file (pypdfium2): {file_path}")
+                        return content
+                    self.logger.warning(
+                        f"pypdfium2 extracted no text from {file_path}; falling back to pdfplumber"
+                    )
+                except Exception as e:
+                    self.logger.warning(
+                        f"pypdfium2 extraction failed ({str(e)}); falling back to pdfplumber"
+                    )
+
             with pdfplumber.open(file_path) as pdf:
-                for page_num, page in enumerate(pdf.pages):
-                    try:
-                        page_text = page.extract_text()
-                        if page_text:
-                            content += f"\n--- Page {page_num + 1} ---\n{page_text}\n"
-                    except Exception as e:
-                        self.logger.warning(
-                            f"Failed to extract text from page {page_num + 1}: {str(e)}"
-                        )
-                        continue
+                num_pages = len(pdf.pages)
+
+            if num_pages >= _PDF_PARALLEL_MIN_PAGES:
+                page_texts = self._extract_pdf_pages_parallel(file_path, num_pages)
+            else:
+                page_texts = self._extract_pdf_pages_serial(file_path)
+
+            content = ""
+            for page_num, page_text in page_texts:
+                if page_text:
+                    content += f"\n--- Page {page_num} ---\n{page_text}\n"
 
             if not content.strip():
                 raise ValueError(f"No text content extracted from PDF: {file_path}")
@@ -281,76 +701,591 @@ class RAGControlService:
             self.logger.error(f"Failed to read PDF file {file_path}: {str(e)}")
             raise
 
+    def _extract_pdf_pages_serial(self, file_path: str) -> List[tuple]:
+        """Extract (page_number, text) pairs sequentially in-process."""
+        page_texts: List[tuple] = []
+        with pdfplumber.open(file_path) as pdf:
+            for page_num, page in enumerate(pdf.pages):
+                try:
+                    page_texts.append((page_num + 1, page.extract_text() or ""))
+                except Exception as e:
+                    self.logger.warning(
+                        f"Failed to extract text from page {page_num + 1}: {str(e)}"
+                    )
+                    continue
+        return page_texts
+
+    def _extract_pdf_pages_parallel(self, file_path: str, num_pages: int) -> List[tuple]:
+        """
+        Extract (page_number, text) pairs across a process pool, one page per
+        task, then sort by page number so separators stay in document order.
+        Falls back to the serial path if the pool cannot be started.
+        """
+        try:
+            with concurrent.futures.ProcessPoolExecutor() as executor:
+                results = list(
+                    executor.map(
+                        _extract_pdf_page_text,
+                        [(file_path, n) for n in range(1, num_pages + 1)],
+                        chunksize=4,
+                    )
+                )
+            results.sort(key=lambda item: item[0])
+            self.logger.info(
+                f"Extracted {num_pages} PDF pages in parallel from {file_path}"
+            )
+            return results
+        except Exception as e:
+            self.logger.warning(
+                f"Parallel PDF extraction failed ({str(e)}); falling back to serial"
+            )
+            return self._extract_pdf_pages_serial(file_path)
+
     # --------------------------------------------------------------------------
     # Text Chunking
     # --------------------------------------------------------------------------
-    def _chunk_text(self, text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+    def _iter_chunks(self, text: str, chunk_size: int = 1000, overlap: int = 200):
         """
-        Split text into overlapping chunks for better retrieval.
+        Yield overlapping chunks one at a time (streaming core of the
+        chunker), so callers can process arbitrarily large documents in
+        bounded memory instead of materializing every chunk up front.
 
         Attempts to break near sentence boundaries if a boundary occurs
         after ~70% of the current window.
         """
-        try:
-            if not text.strip():
-                return []
-
-            text = re.sub(r"\s+", " ", text.strip())  # normalize whitespace
+        if not text.strip():
+            return
 
-            chunks: List[str] = []
-            start = 0
-            L = len(text)
+        text = _normalize_whitespace(text)
 
-            while start < L:
-                end = start + chunk_size
-                chunk = text[start:end]
+        start = 0
+        L = len(text)
+        break_positions = _find_break_positions(text)
 
-                if end < L:
-                    last_period = chunk.rfind(".")
-                    last_exclamation = chunk.rfind("!")
-                    last_question = chunk.rfind("?")
-                    last_newline = chunk.rfind("\n")
-                    break_point = max(last_period, last_exclamation, last_question, last_newline)
+        while start < L:
+            end = start + chunk_size
 
-                    if break_point > chunk_size * 0.7:
-                        chunk = chunk[: break_point + 1]
-                        end = start + break_point + 1
-
-                chunks.append(chunk.strip())
-                start = end - overlap
-                if start >= L:
-                    break
+            if end < L:
+                if break_positions is not None:
+                    # Last boundary before `end` via binary search on the
+                    # precomputed index array (O(log n) per chunk).
+                    idx = np.searchsorted(break_positions, end, side="left") - 1
+                    if idx >= 0 and break_positions[idx] >= start:
+                        break_point = int(break_positions[idx]) - start
+                    else:
+                        break_point = -1
+                else:
+                    # rfind with explicit bounds searches in place — no
+                    # intermediate window slice is allocated.
+                    absolute_break = max(
+                        text.rfind(".", start, end),
+                        text.rfind("!", start, end),
+                        text.rfind("?", start, end),
+                        text.rfind("\n", start, end),
+                    )
+                    break_point = absolute_break - start if absolute_break >= 0 else -1
+
+                if break_point > chunk_size * 0.7:
+                    end = start + break_point + 1
+
+            # Trim surrounding spaces by index arithmetic (whitespace is
+            # already normalized to single spaces), so the one slice below
+            # is the only string copy made per chunk.
+            trim_start, trim_end = start, min(end, L)
+            while trim_start < trim_end and text[trim_start] == " ":
+                trim_start += 1
+            while trim_end > trim_start and text[trim_end - 1] == " ":
+                trim_end -= 1
+            yield text[trim_start:trim_end]
+
+            start = end - overlap
+            if start >= L:
+                break
 
-            self.logger.info(f"Created {len(chunks)} chunks from text")
+    def _chunk_text(self, text: str, chunk_size: int = 1000, overlap: int = 200) -> List[str]:
+        """Split text into overlapping chunks (materialized; see _iter_chunks)."""
+        try:
+            chunks = list(self._iter_chunks(text, chunk_size, overlap))
+            self.logger.debug(f"Created {len(chunks)} chunks from text")
             return chunks
 
         except Exception as e:
             self.logger.error(f"Failed to chunk text: {str(e)}")
             raise
 
+    # --------------------------------------------------------------------------
+    # Ingest Manifest
+    # --------------------------------------------------------------------------
+    def _load_manifest(self) -> Dict[str, Any]:
+        """Load the ingest manifest; a missing or corrupt file means empty."""
+        try:
+            if os.path.exists(self._manifest_path):
+                with open(self._manifest_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+        except Exception as e:
+            self.logger.warning(f"Could not load ingest manifest: {str(e)}")
+        return {}
+
+    def _save_manifest(self) -> None:
+        """Persist the manifest atomically; callers hold _manifest_lock."""
+        try:
+            tmp_path = self._manifest_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._manifest, f)
+            os.replace(tmp_path, self._manifest_path)
+        except Exception as e:
+            self.logger.warning(f"Could not save ingest manifest: {str(e)}")
+
+    def _manifest_lookup(self, file_path: str, st: os.stat_result) -> Optional[str]:
+        """Return the cached document_id if the file is unchanged on disk."""
+        entry = self._manifest.get(file_path)
+        if (
+            isinstance(entry, dict)
+            and entry.get("mtime_ns") == st.st_mtime_ns
+            and entry.get("size") == st.st_size
+        ):
+            return entry.get("document_id")
+        return None
+
+    def _manifest_record(self, file_path: str, st: os.stat_result, document_id: str) -> None:
+        """Record a successful ingest for future short-circuiting."""
+        with self._manifest_lock:
+            self._manifest[file_path] = {
+                "document_id": document_id,
+                "mtime_ns": st.st_mtime_ns,
+                "size": st.st_size,
+            }
+            self._save_manifest()
+
+    def _manifest_forget(self, document_ids) -> None:
+        """Drop manifest entries for deleted documents."""
+        with self._manifest_lock:
+            stale = [
+                path for path, entry in self._manifest.items()
+                if isinstance(entry, dict) and entry.get("document_id") in document_ids
+            ]
+            if stale:
+                for path in stale:
+                    del self._manifest[path]
+                self._save_manifest()
+
+    # --------------------------------------------------------------------------
+    # Per-document Counters (sidecar)
+    # --------------------------------------------------------------------------
+    def _load_doc_counts(self) -> Optional[Dict[str, Dict[str, int]]]:
+        """
+        Load the per-document counter sidecar. Returns None when the file is
+        absent or unreadable for a non-empty collection, which callers treat
+        as "rebuild from a scan"; an empty collection starts authoritative.
+        """
+        try:
+            if os.path.exists(self._doc_counts_path):
+                with open(self._doc_counts_path, "r", encoding="utf-8") as f:
+                    data = json.load(f)
+                if isinstance(data, dict):
+                    return data
+        except Exception as e:
+            self.logger.warning(f"Could not load document counters: {str(e)}")
+        try:
+            if self.collection.count() == 0:
+                return {}
+        except Exception:
+            pass
+        return None
+
+    def _save_doc_counts(self) -> None:
+        """Persist the counter sidecar atomically (temp write + replace)."""
+        if self._doc_chunk_counts is None:
+            return
+        try:
+            tmp_path = self._doc_counts_path + ".tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(self._doc_chunk_counts, f)
+            os.replace(tmp_path, self._doc_counts_path)
+        except Exception as e:
+            self.logger.warning(f"Could not save document counters: {str(e)}")
+
+    def _doc_counts_record_add(self, document_id: str, n_chunks: int, n_chars: int) -> None:
+        """Fold a successful ingest into the counter sidecar."""
+        if self._doc_chunk_counts is None:
+            return
+        entry = self._doc_chunk_counts.setdefault(document_id, {"chunks": 0, "chars": 0})
+        entry["chunks"] += n_chunks
+        entry["chars"] += n_chars
+        self._save_doc_counts()
+
+    def _doc_counts_record_delete(self, document_ids) -> None:
+        """Drop deleted documents from the counter sidecar."""
+        if self._doc_chunk_counts is None:
+            return
+        changed = False
+        for document_id in document_ids:
+            if self._doc_chunk_counts.pop(document_id, None) is not None:
+                changed = True
+        if changed:
+            self._save_doc_counts()
+
+    # --------------------------------------------------------------------------
+    # Path index sidecar (file_path -> chunk ids)
+    # --------------------------------------------------------------------------
+    def _open_path_index(self) -> Optional[sqlite3.Connection]:
+        """
+        Open (or create) the path-index sidecar database.
+
+        WAL mode keeps readers non-blocking while the background writer
+        records ingests; check_same_thread is off for the same reason.
+        Returns None if the sidecar cannot be opened.
+        """
+        try:
+            conn = sqlite3.connect(self._path_index_path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS path_index ("
+                "path TEXT PRIMARY KEY, "
+                "basename TEXT, "
+                "document_id TEXT, "
+                "chunk_ids BLOB, "
+                "file_type TEXT, "
+                "total_chunks INTEGER, "
+                "timestamp TEXT)"
+            )
+            # Summary columns were added after the first sidecar release;
+            # older files gain them in place (NULL until the next ingest).
+            for column, column_type in (
+                ("file_type", "TEXT"),
+                ("total_chunks", "INTEGER"),
+                ("timestamp", "TEXT"),
+            ):
+                try:
+                    conn.execute(f"ALTER TABLE path_index ADD COLUMN {column} {column_type}")
+                except sqlite3.OperationalError:
+                    pass
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_path_index_basename "
+                "ON path_index(basename)"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_path_index_document_id "
+                "ON path_index(document_id)"
+            )
+            conn.commit()
+            return conn
+        except Exception as e:
+            self.logger.warning("Could not open path index sidecar: %s", str(e))
+            return None
+
+    def _path_index_record(
+        self,
+        file_path: str,
+        document_id: str,
+        chunk_ids: List[str],
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """
+        Record (or replace) the chunk ids stored for a file path, plus a
+        small document summary so existence checks can skip the full scan.
+        """
+        if self._path_index is None:
+            return
+        metadata = metadata or {}
+        try:
+            with self._path_index_lock:
+                self._path_index.execute(
+                    "INSERT OR REPLACE INTO path_index "
+                    "(path, basename, document_id, chunk_ids, "
+                    "file_type, total_chunks, timestamp) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        file_path,
+                        os.path.basename(file_path),
+                        document_id,
+                        json.dumps(chunk_ids).encode("utf-8"),
+                        metadata.get("file_type"),
+                        metadata.get("total_chunks", len(chunk_ids)),
+                        metadata.get("timestamp"),
+                    ),
+                )
+                self._path_index.commit()
+        except Exception as e:
+            self.logger.warning("Could not update path index: %s", str(e))
+
+    def _path_index_lookup(self, file_path: str) -> Optional[tuple]:
+        """
+        Resolve a file path to (chunk_ids, document_ids) via the sidecar.
+
+        Tries the exact path first, then the basename index (covers rows
+        recorded under a different working directory). Returns None on a
+        miss or when the sidecar is unavailable.
+        """
+        if self._path_index is None:
+            return None
+        try:
+            with self._path_index_lock:
+                rows = self._path_index.execute(
+                    "SELECT document_id, chunk_ids FROM path_index WHERE path = ?",
+                    (file_path,),
+                ).fetchall()
+                if not rows:
+                    rows = self._path_index.execute(
+                        "SELECT document_id, chunk_ids FROM path_index WHERE basename = ?",
+                        (os.path.basename(file_path),),
+                    ).fetchall()
+            if not rows:
+                return None
+            chunk_ids: List[str] = []
+            document_ids: set = set()
+            for document_id, raw_ids in rows:
+                chunk_ids.extend(json.loads(raw_ids))
+                document_ids.add(document_id)
+            return chunk_ids, document_ids
+        except Exception as e:
+            self.logger.warning("Could not read path index: %s", str(e))
+            return None
+
+    def find_document_by_path(self, file_path: str) -> Optional[Dict[str, Any]]:
+        """
+        Resolve a file path to its stored document summary via the sidecar.
+
+        Returns {"document_id", "file_type", "total_chunks", "timestamp"}
+        or None when the sidecar is unavailable, the path is unknown, or
+        the row predates the summary columns — callers should then fall
+        back to list_documents().
+        """
+        if self._path_index is None:
+            return None
+        try:
+            with self._path_index_lock:
+                row = self._path_index.execute(
+                    "SELECT document_id, file_type, total_chunks, timestamp "
+                    "FROM path_index WHERE path = ?",
+                    (file_path,),
+                ).fetchone()
+                if row is None:
+                    row = self._path_index.execute(
+                        "SELECT document_id, file_type, total_chunks, timestamp "
+                        "FROM path_index WHERE basename = ?",
+                        (os.path.basename(file_path),),
+                    ).fetchone()
+            if row is None or row[1] is None:
+                return None
+            return {
+                "document_id": row[0],
+                "file_type": row[1],
+                "total_chunks": row[2],
+                "timestamp": row[3],
+            }
+        except Exception as e:
+            self.logger.warning("Could not read path index: %s", str(e))
+            return None
+
+    def _path_index_forget_docs(self, document_ids) -> None:
+        """Drop all index rows belonging to the given document ids."""
+        if self._path_index is None or not document_ids:
+            return
+        try:
+            with self._path_index_lock:
+                self._path_index.executemany(
+                    "DELETE FROM path_index WHERE document_id = ?",
+                    [(document_id,) for document_id in document_ids],
+                )
+                self._path_index.commit()
+        except Exception as e:
+            self.logger.warning("Could not prune path index: %s", str(e))
+
+    # --------------------------------------------------------------------------
+    # Query Cache
+    # --------------------------------------------------------------------------
+    def _query_cache_key(self, query: str, document_filter: Optional[str], n_results: int) -> bytes:
+        """Build a compact cache key from the full search signature."""
+        raw = f"{query}\x00{document_filter}\x00{n_results}".encode("utf-8")
+        return hashlib.blake2b(raw, digest_size=16).digest()
+
+    @staticmethod
+    def _copy_search_response(value: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a search response including its nested results list. A flat
+        dict() copy would still share the hit dicts with the cache, so a
+        caller sorting results or annotating a hit could rewrite the
+        cached entry for every later hit of the same query.
+        """
+        return {**value, "results": [dict(hit) for hit in value.get("results", [])]}
+
+    def _query_cache_get(self, key: bytes) -> Optional[Dict[str, Any]]:
+        """Return a cached search result if present and not expired.
+
+        Hands back a copy (nested results included) so a caller mutating
+        its response cannot poison the cached entry.
+        """
+        with self._query_cache_lock:
+            entry = self._query_cache.get(key)
+            if entry is None:
+                return None
+            cached_at, value = entry
+            if time.monotonic() - cached_at > self._query_cache_ttl_seconds:
+                del self._query_cache[key]
+                return None
+            self._query_cache.move_to_end(key)
+            return self._copy_search_response(value)
+
+    def _query_cache_put(self, key: bytes, value: Dict[str, Any]) -> None:
+        """Store a copy of a search result, evicting least-recently-used entries."""
+        with self._query_cache_lock:
+            self._query_cache[key] = (time.monotonic(), self._copy_search_response(value))
+            self._query_cache.move_to_end(key)
+            while len(self._query_cache) > self._query_cache_max_size:
+                self._query_cache.popitem(last=False)
+
+    def _invalidate_query_cache(self) -> None:
+        """Drop all cached search results after any collection mutation."""
+        with self._query_cache_lock:
+            self._query_cache.clear()
+
+    def _mark_collection_mutated(self) -> None:
+        """Bump the collection version and drop derived caches after a write."""
+        self._collection_version += 1
+        self._stats_cache = None
+        self._invalidate_query_cache()
+
     # --------------------------------------------------------------------------
     # Existence Check
     # --------------------------------------------------------------------------
+    def _load_known_doc_ids(self) -> set:
+        """Populate the known-document-ID set with a single metadata scan."""
+        doc_ids: set = set()
+        parsed = _ChromaResult.from_raw(self.collection.get(include=["metadatas"]))
+        if parsed is not None:
+            for meta in parsed.metadatas:
+                if meta and "document_id" in meta:
+                    doc_ids.add(meta["document_id"])
+        return doc_ids
+
     def _check_document_exists(self, document_id: str) -> bool:
         """Return True if any chunk with this document_id exists in collection."""
         try:
-            results = self.collection.get(where={"document_id": document_id}, limit=1)
-            if not results or not isinstance(results, dict) or "ids" not in results:
-                return False
-            if not isinstance(results["ids"], list):
-                return False
-            return len(results["ids"]) > 0
+            if self._known_doc_ids is None:
+                self._known_doc_ids = self._load_known_doc_ids()
+            return document_id in self._known_doc_ids
         except Exception as e:
             self.logger.error(f"Failed to check document existence: {str(e)}")
             return False
 
+    # --------------------------------------------------------------------------
+    # Embedding (ingest-side batching)
+    # --------------------------------------------------------------------------
+    def _embed_chunks(self, chunks: List[str], batch_size: Optional[int] = None) -> List[Any]:
+        """
+        Embed chunks in fixed-size batches, sorted by length.
+
+        Transformer backends pad every text in a batch to the longest one,
+        so mixing one long chunk with many short ones wastes compute.
+        Sorting by length keeps padding tight within each batch; results
+        are scattered back to the original chunk order before returning.
+        The default batch size is method-aware (see __init__).
+        """
+        if batch_size is None:
+            batch_size = self._embed_batch_size
+        order = sorted(range(len(chunks)), key=lambda i: len(chunks[i]))
+        embeddings: List[Any] = [None] * len(chunks)
+
+        batches = [
+            order[batch_start:batch_start + batch_size]
+            for batch_start in range(0, len(order), batch_size)
+        ]
+
+        if self.embedding_method == "OpenAIEmbeddings" and len(batches) > 1:
+            # API batches are network-bound, not compute-bound, so fan the
+            # requests out across threads; total latency drops from
+            # O(batches) round-trips to roughly one.
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(8, len(batches)), thread_name_prefix="rag-embed"
+            ) as pool:
+                batch_results = list(
+                    pool.map(
+                        lambda indices: self._embedding_fn([chunks[i] for i in indices]),
+                        batches,
+                    )
+                )
+        else:
+            batch_results = [
+                self._embedding_fn([chunks[i] for i in indices]) for indices in batches
+            ]
+
+        for batch_indices, batch_embeddings in zip(batches, batch_results):
+            for original_index, embedding in zip(batch_indices, batch_embeddings):
+                embeddings[original_index] = embedding
+
+        return embeddings
+
+    def _add_chunk_batches(
+        self,
+        chunks: List[str],
+        chunk_ids: List[str],
+        metadatas: List[Dict[str, Any]],
+        document_id: str,
+        file_path: str,
+    ) -> None:
+        """
+        Embed and insert chunks in fixed-size batches so peak memory stays
+        bounded by the batch, not the document; each batch is embedded with
+        length-sorted sub-batching (see _embed_chunks). Runs inline or on
+        the background writer depending on `async_writes`.
+        """
+        n_chunks = len(chunks)
+        batch_size = self._ingest_batch_size
+        for batch_start in range(0, n_chunks, batch_size):
+            batch_end = min(batch_start + batch_size, n_chunks)
+            batch_docs = chunks[batch_start:batch_end]
+            # Embedding runs outside the lock (it is the parallel part);
+            # only the actual write is serialized.
+            batch_embeddings = self._embed_chunks(batch_docs)
+            with self._collection_write_lock:
+                self.collection.add(
+                    documents=batch_docs,
+                    ids=chunk_ids[batch_start:batch_end],
+                    metadatas=metadatas[batch_start:batch_end],
+                    embeddings=batch_embeddings,
+                )
+        with self._collection_write_lock:
+            if self._known_doc_ids is not None:
+                self._known_doc_ids.add(document_id)
+            self._doc_counts_record_add(document_id, n_chunks, sum(len(c) for c in chunks))
+            self._path_index_record(
+                os.path.abspath(file_path),
+                document_id,
+                chunk_ids,
+                metadatas[0] if metadatas else None,
+            )
+            self._mark_collection_mutated()
+        self.logger.info(
+            f"Stored document {file_path} with {n_chunks} chunks "
+            f"in collection '{self.collection_name}'"
+        )
+
+    def flush(self) -> None:
+        """
+        Block until all queued background writes have completed.
+
+        Re-raises the first write error, mirroring what the synchronous
+        path would have raised from study_document.
+        """
+        with self._pending_writes_lock:
+            pending = list(self._pending_writes)
+            self._pending_writes.clear()
+        for future in pending:
+            future.result()
+
     # --------------------------------------------------------------------------
     # Public API: Study (Ingest)
     # --------------------------------------------------------------------------
-    def study_document(self, file_path: str, file_type: str = "md") -> Dict[str, Any]:
+    def study_document(self, file_path: str, file_type: str = "md", fast: bool = True) -> Dict[str, Any]:
         """
         Study and store a document (markdown or PDF) in the ChromaDB database.
 
+        `fast` selects the pypdfium2 text-only PDF backend when available;
+        pass False to force the pdfplumber layout-aware path.
+
         Returns a summary with document_id and chunk count.
         """
         try:
@@ -359,13 +1294,33 @@ class RAGControlService:
                 f"into collection '{self.collection_name}'"
             )
 
-            if not os.path.exists(file_path):
-                raise FileNotFoundError(f"File not found: {file_path}")
+            # One stat() both validates existence and feeds the manifest
+            # check — no separate os.path.exists probe.
+            abs_path = os.path.abspath(file_path)
+            try:
+                st = os.stat(abs_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {file_path}") from None
+
+            # Manifest short-circuit: if mtime+size are unchanged since the
+            # last successful ingest, skip hashing/parsing entirely.
+            cached_doc_id = self._manifest_lookup(abs_path, st)
+            if cached_doc_id is not None and self._check_document_exists(cached_doc_id):
+                self.logger.info(f"Skipping unchanged file (manifest match): {file_path}")
+                return {
+                    "status": "exists",
+                    "document_id": cached_doc_id,
+                    "file_path": abs_path,
+                    "message": "Document unchanged since last study (manifest match)",
+                    "collection_name": self.collection_name,
+                    "embedding_method": self.embedding_method,
+                }
 
-            document_id = self._generate_document_id(file_path)
+            document_id = self._generate_document_id(abs_path)
 
             if self._check_document_exists(document_id):
                 self.logger.warning(f"Document already exists in database: {file_path}")
+                self._manifest_record(abs_path, st, document_id)
                 return {
                     "status": "exists",
                     "document_id": document_id,
@@ -378,9 +1333,9 @@ class RAGControlService:
             # Read content
             file_type_lower = file_type.lower()
             if file_type_lower == "md":
-                content = self._read_markdown_file(file_path)
+                content = self._read_markdown_file(abs_path)
             elif file_type_lower == "pdf":
-                content = self._read_pdf_file(file_path)
+                content = self._read_pdf_file(abs_path, fast=fast)
             else:
                 raise ValueError(f"Unsupported file type: {file_type}")
 
@@ -390,35 +1345,61 @@ class RAGControlService:
             if not chunks:
                 raise ValueError(f"No content extracted from file: {file_path}")
 
-            # IDs & metadata
-            chunk_ids = [f"{document_id}_chunk_{i}" for i in range(len(chunks))]
+            # IDs & metadata: hoist everything constant across chunks out of
+            # the comprehensions — one timestamp, one ID prefix, one base
+            # dict — so per-chunk work is a concat and a dict merge.
+            n_chunks = len(chunks)
+            chunk_prefix = document_id + "_chunk_"
+            chunk_ids = [chunk_prefix + str(i) for i in range(n_chunks)]
             timestamp = datetime.now().isoformat()
+            base_metadata = {
+                "document_id": document_id,
+                "file_path": abs_path,
+                # Basename stored separately so filename lookups can use an
+                # indexed metadata filter instead of a Python scan.
+                "filename": os.path.basename(abs_path),
+                "file_type": file_type_lower,
+                "total_chunks": n_chunks,
+                "content_hash": document_id[len("doc_"):],
+                "timestamp": timestamp,
+                "embedding_method": self.embedding_method,
+                "collection_name": self.collection_name,
+            }
+            # Per-chunk character count is stored so stats can be computed
+            # from metadata alone, without re-fetching chunk bodies.
             metadatas = [
-                {
+                {**base_metadata, "chunk_index": i, "chunk_chars": len(chunks[i])}
+                for i in range(n_chunks)
+            ]
+
+            if self.async_writes:
+                # Queue the embed+write work and return immediately; the
+                # caller polls with flush() when durability matters.
+                future = self._writer.submit(
+                    self._add_chunk_batches, chunks, chunk_ids, metadatas, document_id, file_path
+                )
+                with self._pending_writes_lock:
+                    self._pending_writes = [f for f in self._pending_writes if not f.done()]
+                    self._pending_writes.append(future)
+                self._manifest_record(abs_path, st, document_id)
+                return {
+                    "status": "queued",
                     "document_id": document_id,
-                    "file_path": os.path.abspath(file_path),
+                    "file_path": abs_path,
+                    "chunks_count": n_chunks,
                     "file_type": file_type_lower,
-                    "chunk_index": i,
-                    "total_chunks": len(chunks),
-                    "timestamp": timestamp,
-                    "embedding_method": self.embedding_method,
                     "collection_name": self.collection_name,
+                    "embedding_method": self.embedding_method,
+                    "message": f"Document queued for background storage with {n_chunks} chunks",
                 }
-                for i in range(len(chunks))
-            ]
 
-            # Add to Chroma (auto-embeds via collection's embedding_function)
-            self.collection.add(documents=chunks, ids=chunk_ids, metadatas=metadatas)
-
-            self.logger.info(
-                f"Stored document {file_path} with {len(chunks)} chunks "
-                f"in collection '{self.collection_name}'"
-            )
+            self._add_chunk_batches(chunks, chunk_ids, metadatas, document_id, file_path)
+            self._manifest_record(abs_path, st, document_id)
 
             return {
                 "status": "success",
                 "document_id": document_id,
-                "file_path": os.path.abspath(file_path),
+                "file_path": abs_path,
                 "chunks_count": len(chunks),
                 "file_type": file_type_lower,
                 "collection_name": self.collection_name,
@@ -430,9 +1411,67 @@ class RAGControlService:
             self.logger.error(f"Failed to study document {file_path}: {str(e)}")
             raise
 
+    def study_documents(
+        self, file_paths: List[str], file_type: str = "md", fast: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Study several documents concurrently.
+
+        PDF extraction and embedding both run in C extensions that release
+        the GIL, so threads overlap per-file work while sharing the single
+        loaded embedding model; collection writes stay serialized behind
+        the write lock in _add_chunk_batches. Results keep the order of
+        `file_paths`, and a failed file yields an error entry instead of
+        aborting the whole batch.
+        """
+        if not file_paths:
+            return []
+
+        self.logger.info(f"Studying {len(file_paths)} documents concurrently")
+
+        def _study_one(path: str) -> Dict[str, Any]:
+            try:
+                return self.study_document(path, file_type=file_type, fast=fast)
+            except Exception as e:
+                self.logger.error("Failed to study document %s: %s", path, str(e))
+                return {"status": "error", "file_path": path, "message": str(e)}
+
+        max_workers = min(8, os.cpu_count() or 1, len(file_paths))
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix="rag-study"
+        ) as pool:
+            return list(pool.map(_study_one, file_paths))
+
     # --------------------------------------------------------------------------
     # Public API: Search
     # --------------------------------------------------------------------------
+    @staticmethod
+    def _document_filter_where(document_filter: Optional[str]) -> Optional[Dict[str, Any]]:
+        """Translate a document_id/file_path filter into a Chroma where clause."""
+        if not document_filter:
+            return None
+        if document_filter.startswith("doc_"):
+            return {"document_id": document_filter}
+        return {"file_path": os.path.abspath(document_filter)}
+
+    @staticmethod
+    def _format_query_hits(results: Any, column: int) -> List[Dict[str, Any]]:
+        """Shape one query's worth of a Chroma query response into hit dicts."""
+        formatted_results: List[Dict[str, Any]] = []
+        if results and "documents" in results and results["documents"]:
+            documents = results["documents"][column]
+            ids = results["ids"][column]
+            metadatas = results["metadatas"][column]
+            distances = results["distances"][column] if "distances" in results else None
+            for i in range(len(documents)):
+                formatted_results.append({
+                    "chunk_id": ids[i],
+                    "content": documents[i],
+                    "metadata": metadatas[i],
+                    "distance": distances[i] if distances is not None else None,
+                })
+        return formatted_results
+
     def search_documents(
         self,
         query: str,
@@ -453,31 +1492,31 @@ class RAGControlService:
             if not query or not query.strip():
                 raise ValueError("Search query cannot be empty")
 
-            where_clause = None
-            if document_filter:
-                if document_filter.startswith("doc_"):
-                    where_clause = {"document_id": document_filter}
-                else:
-                    where_clause = {"file_path": os.path.abspath(document_filter)}
+            # Normalize once so " query" and "query" share cache entries
+            # (both the result cache and the embedding LRU key on this).
+            query = query.strip()
+
+            cache_key = self._query_cache_key(query, document_filter, n_results)
+            cached = self._query_cache_get(cache_key)
+            if cached is not None:
+                self.logger.info("Search served from query cache")
+                return cached
 
+            where_clause = self._document_filter_where(document_filter)
+
+            # Embed the query through the per-query LRU cache and hand the
+            # vector to Chroma directly, so repeated queries (even after
+            # the result cache was invalidated by a write) skip the model.
+            query_embedding = list(self._query_embedding(query))
             results = self.collection.query(
-                query_texts=[query], n_results=n_results, where=where_clause
+                query_embeddings=[query_embedding], n_results=n_results, where=where_clause
             )
 
-            formatted_results: List[Dict[str, Any]] = []
-            if results and "documents" in results and results["documents"]:
-                for i in range(len(results["documents"][0])):
-                    result = {
-                        "chunk_id": results["ids"][0][i],
-                        "content": results["documents"][0][i],
-                        "metadata": results["metadatas"][0][i],
-                        "distance": results["distances"][0][i] if "distances" in results else None,
-                    }
-                    formatted_results.append(result)
+            formatted_results = self._format_query_hits(results, 0)
 
             self.logger.info(f"Search completed, found {len(formatted_results)} results")
 
-            return {
+            response = {
                 "status": "success",
                 "query": query,
                 "results_count": len(formatted_results),
@@ -486,14 +1525,137 @@ class RAGControlService:
                 "collection_name": self.collection_name,
                 "embedding_method": self.embedding_method,
             }
+            self._query_cache_put(cache_key, response)
+            return response
 
         except Exception as e:
             self.logger.error(f"Failed to search documents: {str(e)}")
             raise
 
+    def search_documents_iter(
+        self,
+        query: str,
+        document_filter: Optional[str] = None,
+        n_results: int = 5,
+    ):
+        """
+        Generator variant of search_documents: yields hit dicts one at a
+        time instead of materializing the response envelope.
+
+        Consumers that process hits incrementally (streaming output,
+        piping, early break after the first good hit) avoid holding all
+        formatted results plus the envelope in memory at once, and a
+        `break` stops the per-hit conversion work early. Bypasses the
+        result cache — the cache stores whole envelopes, and a partially
+        consumed generator has none to store.
+        """
+        if not query or not query.strip():
+            raise ValueError("Search query cannot be empty")
+        query = query.strip()
+
+        where_clause = self._document_filter_where(document_filter)
+        query_embedding = list(self._query_embedding(query))
+        results = self.collection.query(
+            query_embeddings=[query_embedding], n_results=n_results, where=where_clause
+        )
+
+        if not (results and "documents" in results and results["documents"]):
+            return
+        documents = results["documents"][0]
+        ids = results["ids"][0]
+        metadatas = results["metadatas"][0]
+        distances = results["distances"][0] if "distances" in results else None
+        for i in range(len(documents)):
+            yield {
+                "chunk_id": ids[i],
+                "content": documents[i],
+                "metadata": metadatas[i],
+                "distance": distances[i] if distances is not None else None,
+            }
+
+    def search_documents_batch(
+        self,
+        queries: List[str],
+        document_filter: Optional[str] = None,
+        n_results: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search several queries against the collection in one call.
+
+        All cache-missing queries are embedded in one backend pass (see
+        _embed_chunks) and handed to Chroma as a single multi-vector
+        query, so the filter evaluation and the Python-to-native crossing
+        are paid once instead of per query. Results keep the order of
+        `queries`; each entry is shaped exactly like a search_documents
+        response and lands in the same result cache.
+        """
+        try:
+            queries = [q.strip() for q in queries]
+            if not queries or any(not q for q in queries):
+                raise ValueError("Search queries cannot be empty")
+
+            self.logger.info(
+                "Batch searching '%s' with %d queries (embedding: %s)",
+                self.collection_name, len(queries), self.embedding_method,
+            )
+
+            where_clause = self._document_filter_where(document_filter)
+
+            # Serve what the result cache already has; only the misses go
+            # through the model and the index.
+            responses: List[Optional[Dict[str, Any]]] = [None] * len(queries)
+            misses: List[tuple] = []
+            for i, query in enumerate(queries):
+                cache_key = self._query_cache_key(query, document_filter, n_results)
+                cached = self._query_cache_get(cache_key)
+                if cached is not None:
+                    responses[i] = cached
+                else:
+                    misses.append((i, query, cache_key))
+
+            if misses:
+                embeddings = self._embed_chunks([query for _, query, _ in misses])
+                results = self.collection.query(
+                    query_embeddings=[list(e) for e in embeddings],
+                    n_results=n_results,
+                    where=where_clause,
+                )
+                for column, (i, query, cache_key) in enumerate(misses):
+                    formatted_results = self._format_query_hits(results, column)
+                    response = {
+                        "status": "success",
+                        "query": query,
+                        "results_count": len(formatted_results),
+                        "results": formatted_results,
+                        "filter_applied": document_filter is not None,
+                        "collection_name": self.collection_name,
+                        "embedding_method": self.embedding_method,
+                    }
+                    self._query_cache_put(cache_key, response)
+                    responses[i] = response
+
+            self.logger.info(
+                "Batch search completed: %d queries, %d served from cache",
+                len(queries), len(queries) - len(misses),
+            )
+            return responses
+
+        except Exception as e:
+            self.logger.error(f"Failed to batch search documents: {str(e)}")
+            raise
+
     # --------------------------------------------------------------------------
     # Public API: List
     # --------------------------------------------------------------------------
+    @staticmethod
+    def _copy_doc_list_response(value: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy a list_documents response including its nested documents list,
+        for the same reason as _copy_search_response: a flat copy would
+        share the per-document dicts between the cache and every caller.
+        """
+        return {**value, "documents": [dict(doc) for doc in value.get("documents", [])]}
+
     def list_documents(self) -> Dict[str, Any]:
         """
         List unique documents (grouped by document_id) in the active collection.
@@ -504,50 +1666,135 @@ class RAGControlService:
                 f"(embedding: {self.embedding_method})"
             )
 
-            # Probe collection
+            # Serve from cache while the collection is unmutated; any
+            # study/delete bumps the version and implicitly invalidates.
+            cached = self._doc_list_cache
+            if cached is not None and cached[0] == self._collection_version:
+                self.logger.info("Document list served from cache")
+                return self._copy_doc_list_response(cached[1])
+
+            # Listing only needs metadata, so skip the chunk bodies and
+            # embeddings entirely — pulling those for every chunk just to
+            # group by document_id is pure waste.
             try:
-                _ = self.collection.get(limit=1)
-                results = self.collection.get()
+                results = self.collection.get(include=["metadatas"])
             except Exception as e:
                 self.logger.error(f"Error calling collection methods: {str(e)}")
                 return {"status": "success", "documents_count": 0, "documents": []}
 
-            if not results or not isinstance(results, dict):
+            parsed = _ChromaResult.from_raw(results)
+            if parsed is None or len(parsed.ids) == 0:
                 return {"status": "success", "documents_count": 0, "documents": []}
 
-            if "ids" not in results or "metadatas" not in results:
-                return {"status": "success", "documents_count": 0, "documents": []}
-
-            if not isinstance(results["ids"], list) or not isinstance(results["metadatas"], list):
-                return {"status": "success", "documents_count": 0, "documents": []}
-
-            if len(results["ids"]) == 0:
-                return {"status": "success", "documents_count": 0, "documents": []}
-
-            documents: Dict[str, Dict[str, Any]] = {}
-
-            for i, meta in enumerate(results["metadatas"]):
-                if i < len(results["ids"]):
-                    document_id = meta.get("document_id", "unknown")
-                    if document_id not in documents:
-                        documents[document_id] = {
-                            "document_id": document_id,
-                            "file_path": meta.get("file_path", "unknown"),
-                            "file_type": meta.get("file_type", "unknown"),
-                            "total_chunks": meta.get("total_chunks", 0),
-                            "timestamp": meta.get("timestamp", "unknown"),
-                            "embedding_method": meta.get("embedding_method", self.embedding_method),
-                            "collection_name": meta.get("collection_name", self.collection_name),
-                        }
+            # Dedupe with one hash op per chunk: setdefault probes and
+            # reserves the slot in a single lookup, and the summary dict is
+            # only built for the first chunk of each document. The loop
+            # consumes metadatas alone, so no per-row ids bound check.
+            documents: Dict[str, Optional[Dict[str, Any]]] = {}
+
+            for meta in parsed.metadatas:
+                document_id = meta.get("document_id", "unknown")
+                if documents.setdefault(document_id) is None:
+                    documents[document_id] = {
+                        "document_id": document_id,
+                        "file_path": meta.get("file_path", "unknown"),
+                        "file_type": meta.get("file_type", "unknown"),
+                        "total_chunks": meta.get("total_chunks", 0),
+                        "timestamp": meta.get("timestamp", "unknown"),
+                        "embedding_method": meta.get("embedding_method", self.embedding_method),
+                        "collection_name": meta.get("collection_name", self.collection_name),
+                    }
 
             doc_list = list(documents.values())
             self.logger.info(f"Found {len(doc_list)} documents in collection")
-            return {"status": "success", "documents_count": len(doc_list), "documents": doc_list}
+            response = {"status": "success", "documents_count": len(doc_list), "documents": doc_list}
+            self._doc_list_cache = (self._collection_version, self._copy_doc_list_response(response))
+            return response
 
         except Exception as e:
             self.logger.error(f"Failed to list documents: {str(e)}")
             raise
 
+    # --------------------------------------------------------------------------
+    # Deletion helpers
+    # --------------------------------------------------------------------------
+    def _find_chunks_by_filename(self, file_path: str) -> Optional["_ChromaResult"]:
+        """
+        Resolve chunks for a file by basename when the exact-path lookup
+        misses. Tries the indexed `filename` metadata filter first, then a
+        legacy basename scan for chunks ingested before that field existed.
+        Returns a validated _ChromaResult, or None if nothing matches.
+        """
+        filename = _cached_basename(file_path)
+        self.logger.info("No exact path match, trying filename match: %s", filename)
+
+        # Indexed lookup: ingest writes a `filename` metadata field, so
+        # Chroma filters on an indexed scalar instead of shipping every
+        # chunk's metadata into a Python basename loop.
+        parsed = _ChromaResult.from_raw(
+            self.collection.get(where={"filename": filename}, include=["metadatas"])
+        )
+        if parsed is not None and len(parsed.ids) > 0:
+            return parsed
+
+        # Server-side suffix predicate for legacy chunks, where the backend
+        # supports it: one compiled SQLite operator pass beats millions of
+        # Python-level os.path.basename calls. Chroma versions that reject
+        # the operator drop through to the scan below.
+        try:
+            candidate = _ChromaResult.from_raw(
+                self.collection.get(
+                    where={"file_path": {"$regex": f"(^|/){re.escape(filename)}$"}},
+                    include=["metadatas"],
+                )
+            )
+            if candidate is not None and len(candidate.ids) > 0:
+                self.logger.info(
+                    "Found %d chunks by server-side filename match", len(candidate.ids)
+                )
+                return candidate
+        except Exception:
+            self.logger.debug("Server-side filename predicate unsupported; using Python scan")
+
+        # Legacy chunks: scan basenames across the collection once, paging
+        # with limit/offset so a large collection never materializes as one
+        # giant list. The ids and metadatas collected here are returned
+        # directly — re-fetching the same rows by id would just be a second
+        # round-trip.
+        matching_ids: List[str] = []
+        matching_metadatas: List[Dict[str, Any]] = []
+        offset = 0
+        while True:
+            page = _ChromaResult.from_raw(
+                self.collection.get(limit=_SCAN_PAGE, offset=offset, include=["metadatas"])
+            )
+            if page is None or len(page.ids) == 0:
+                break
+            for i, metadata in enumerate(page.metadatas):
+                if i < len(page.ids):
+                    stored_filename = os.path.basename(metadata.get("file_path", ""))
+                    if stored_filename == filename:
+                        matching_ids.append(page.ids[i])
+                        matching_metadatas.append(metadata)
+            if len(page.ids) < _SCAN_PAGE:
+                break
+            offset += _SCAN_PAGE
+
+        if not matching_ids:
+            return None
+
+        self.logger.info("Found %d chunks by filename match", len(matching_ids))
+        return _ChromaResult(ids=matching_ids, metadatas=matching_metadatas, documents=[])
+
+    def _delete_ids_batched(self, ids: List[str]) -> None:
+        """Delete chunk IDs in fixed-size batches (see _DELETE_BATCH)."""
+        for i in range(0, len(ids), _DELETE_BATCH):
+            batch = ids[i:i + _DELETE_BATCH]
+            self.collection.delete(ids=batch)
+            self.logger.debug(
+                "Deleted batch of %d chunks (%d/%d)", len(batch), i + len(batch), len(ids)
+            )
+
     # --------------------------------------------------------------------------
     # Public API: Delete by document_id
     # --------------------------------------------------------------------------
@@ -557,169 +1804,245 @@ class RAGControlService:
         """
         try:
             self.logger.info(
-                f"Deleting document '{document_id}' from collection '{self.collection_name}'"
+                "Deleting document '%s' from collection '%s'", document_id, self.collection_name
             )
 
-            results = self.collection.get(where={"document_id": document_id})
-            if not results or not isinstance(results, dict) or "ids" not in results:
-                return {
-                    "status": "not_found",
-                    "document_id": document_id,
-                    "message": "Document not found in database",
-                }
-
-            if not isinstance(results["ids"], list) or len(results["ids"]) == 0:
+            # Lightweight ID-only fetch purely for the reported chunk count
+            # (include=[] skips documents/metadatas/embeddings payloads).
+            parsed = _ChromaResult.from_raw(
+                self.collection.get(where={"document_id": document_id}, include=[])
+            )
+            if parsed is None or len(parsed.ids) == 0:
                 return {
                     "status": "not_found",
                     "document_id": document_id,
                     "message": "Document not found in database",
                 }
 
-            self.collection.delete(ids=results["ids"])
+            chunks_deleted = len(parsed.ids)
+
+            # Delete by predicate: Chroma filters server-side, so we avoid
+            # marshalling thousands of chunk IDs back across the boundary.
+            self.collection.delete(where={"document_id": document_id})
+            if self._known_doc_ids is not None:
+                self._known_doc_ids.discard(document_id)
+            self._manifest_forget({document_id})
+            self._doc_counts_record_delete({document_id})
+            self._path_index_forget_docs({document_id})
+            self._mark_collection_mutated()
             self.logger.info(
-                f"Successfully deleted document {document_id} with {len(results['ids'])} chunks"
+                "Successfully deleted document %s with %d chunks", document_id, chunks_deleted
             )
 
             return {
                 "status": "success",
                 "document_id": document_id,
-                "chunks_deleted": len(results["ids"]),
-                "message": f"Document successfully deleted with {len(results['ids'])} chunks",
+                "chunks_deleted": chunks_deleted,
+                "message": f"Document successfully deleted with {chunks_deleted} chunks",
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to delete document {document_id}: {str(e)}")
+            self.logger.error("Failed to delete document %s: %s", document_id, str(e))
             raise
 
     # --------------------------------------------------------------------------
     # Public API: Delete by file path
     # --------------------------------------------------------------------------
-    def delete_document_by_file_path(self, file_path: str) -> Dict[str, Any]:
+    def delete_document_by_file_path(
+        self, file_path: str, include_document_ids: bool = False
+    ) -> Dict[str, Any]:
         """
-        Delete a document from the active collection by its file path (exact path),
-        with a filename fallback scan if exact match is not found.
+        Delete a document from the active collection by its file path (exact
+        path), falling back to an indexed `filename` metadata match and, for
+        chunks ingested before that field existed, a legacy basename scan.
+
+        The deleted document_ids are only materialized into the return
+        payload when `include_document_ids` is True; most callers discard
+        the payload, so the extra list build is opt-in.
         """
         try:
-            self.logger.info(f"Attempting to delete document by file path: {file_path}")
+            self.logger.info("Attempting to delete document by file path: %s", file_path)
             if not file_path or not file_path.strip():
                 raise ValueError("File path cannot be empty")
 
-            normalized_file_path = os.path.abspath(file_path)
-
-            results = self.collection.get(where={"file_path": normalized_file_path})
-
-            if not results or not isinstance(results, dict) or "ids" not in results:
-                # Fallback: try filename match scan
-                filename = os.path.basename(file_path)
-                self.logger.info(f"No exact path match, trying filename match: {filename}")
-
-                all_results = self.collection.get()
-                if (
-                    not all_results
-                    or not isinstance(all_results, dict)
-                    or "ids" not in all_results
-                    or "metadatas" not in all_results
-                ):
-                    return {
-                        "status": "not_found",
-                        "file_path": file_path,
-                        "message": f"No document found with file path or filename: {file_path}",
-                    }
-
-                if not isinstance(all_results["ids"], list) or not isinstance(
-                    all_results["metadatas"], list
-                ):
-                    return {
-                        "status": "not_found",
-                        "file_path": file_path,
-                        "message": f"No document found with file path or filename: {file_path}",
-                    }
+            normalized_file_path = _cached_abspath(file_path, self._cwd)
 
-                matching_ids: List[str] = []
-                for i, metadata in enumerate(all_results["metadatas"]):
-                    if i < len(all_results["ids"]):
-                        stored_filename = os.path.basename(metadata.get("file_path", ""))
-                        if stored_filename == filename:
-                            matching_ids.append(all_results["ids"][i])
-
-                if matching_ids:
-                    results = self.collection.get(ids=matching_ids)
-                    self.logger.info(f"Found {len(matching_ids)} chunks by filename match")
-                else:
-                    return {
-                        "status": "not_found",
-                        "file_path": file_path,
-                        "message": f"No document found with file path or filename: {file_path}",
-                    }
+            # Path-index fast path: the sidecar already maps the path to its
+            # chunk ids and document ids, so nothing has to be fetched from
+            # the collection at all before deleting.
+            indexed = self._path_index_lookup(normalized_file_path)
+            if indexed is not None:
+                chunk_ids, doc_id_set = indexed
             else:
-                # validate ids
-                if not isinstance(results["ids"], list) or len(results["ids"]) == 0:
-                    # same fallback as above
-                    filename = os.path.basename(file_path)
-                    self.logger.info(f"No exact path match, trying filename match: {filename}")
-
-                    all_results = self.collection.get()
-                    if (
-                        not all_results
-                        or not isinstance(all_results, dict)
-                        or "ids" not in all_results
-                        or "metadatas" not in all_results
-                    ):
+                parsed = _ChromaResult.from_raw(
+                    self.collection.get(
+                        where={"file_path": normalized_file_path}, include=["metadatas"]
+                    )
+                )
+
+                if parsed is None or len(parsed.ids) == 0:
+                    parsed = self._find_chunks_by_filename(file_path)
+                    if parsed is None:
                         return {
                             "status": "not_found",
                             "file_path": file_path,
                             "message": f"No document found with file path or filename: {file_path}",
                         }
 
-                    if not isinstance(all_results["ids"], list) or not isinstance(
-                        all_results["metadatas"], list
-                    ):
-                        return {
-                            "status": "not_found",
-                            "file_path": file_path,
-                            "message": f"No document found with file path or filename: {file_path}",
-                        }
+                chunk_ids = parsed.ids
+                # One set build covers all the internal bookkeeping below;
+                # the list form only exists if the caller asked for it.
+                doc_id_set = {m.get("document_id", "unknown") for m in parsed.metadatas}
+
+            self._delete_ids_batched(chunk_ids)
+            if self._known_doc_ids is not None:
+                self._known_doc_ids.difference_update(doc_id_set)
+            self._manifest_forget(doc_id_set)
+            self._doc_counts_record_delete(doc_id_set)
+            self._path_index_forget_docs(doc_id_set)
+            self._mark_collection_mutated()
+            self.logger.info(
+                "Successfully deleted document %s with %d chunks", file_path, len(chunk_ids)
+            )
 
-                    matching_ids: List[str] = []
-                    for i, metadata in enumerate(all_results["metadatas"]):
-                        if i < len(all_results["ids"]):
-                            stored_filename = os.path.basename(metadata.get("file_path", ""))
-                            if stored_filename == filename:
-                                matching_ids.append(all_results["ids"][i])
+            result: Dict[str, Any] = {
+                "status": "success",
+                "file_path": file_path,
+                "chunks_deleted": len(chunk_ids),
+                "message": f"Document successfully deleted with {len(chunk_ids)} chunks",
+            }
+            if include_document_ids:
+                result["document_ids"] = sorted(doc_id_set)
+            return result
 
-                    if matching_ids:
-                        results = self.collection.get(ids=matching_ids)
-                        self.logger.info(f"Found {len(matching_ids)} chunks by filename match")
-                    else:
-                        return {
-                            "status": "not_found",
-                            "file_path": file_path,
-                            "message": f"No document found with file path or filename: {file_path}",
-                        }
+        except Exception as e:
+            self.logger.error("Failed to delete document by file path %s: %s", file_path, str(e))
+            raise
+
+    # --------------------------------------------------------------------------
+    # Public API: Delete many by file path
+    # --------------------------------------------------------------------------
+    def delete_documents_by_file_paths(self, file_paths: List[str]) -> Dict[str, Any]:
+        """
+        Delete several documents by file path with one collection scan.
+
+        Calling delete_document_by_file_path in a loop walks the whole
+        collection once per file (K×N work). Here the metadata is fetched
+        exactly once and every chunk is partitioned into per-file buckets
+        with O(1) set lookups (N+K total).
+
+        Matching mirrors the single-file delete: chunks whose stored
+        `file_path` equals the normalized input are matched first, and the
+        legacy basename match is used only for inputs whose exact path
+        matched nothing. Chunks claimed by an exact path are never handed
+        to another input's basename fallback, and results are keyed by the
+        input path so two inputs sharing a basename each get their own
+        entry.
+        """
+        try:
+            self.logger.info("Batch-deleting %d documents by file path", len(file_paths))
+            if not file_paths:
+                return {
+                    "status": "success",
+                    "files_deleted": 0,
+                    "chunks_deleted": 0,
+                    "results": [],
+                }
 
-            if not isinstance(results, dict) or "ids" not in results or "metadatas" not in results:
-                return {"status": "error", "file_path": file_path, "message": "Invalid results structure"}
+            # Normalize once up front; duplicate input strings collapse, but
+            # distinct paths sharing a basename stay distinct entries.
+            wanted = {p: _cached_abspath(p, self._cwd) for p in dict.fromkeys(file_paths)}
+            wanted_paths = set(wanted.values())
+            wanted_names = {_cached_basename(p) for p in wanted}
+
+            all_results = _ChromaResult.from_raw(self.collection.get(include=["metadatas"]))
+            path_buckets: Dict[str, List[tuple]] = {}
+            name_buckets: Dict[str, List[tuple]] = {}
+            if all_results is not None:
+                for i, metadata in enumerate(all_results.metadatas):
+                    if i < len(all_results.ids):
+                        entry = (all_results.ids[i], metadata.get("document_id", "unknown"))
+                        stored_path = metadata.get("file_path", "")
+                        if stored_path in wanted_paths:
+                            path_buckets.setdefault(stored_path, []).append(entry)
+                        stored_filename = metadata.get("filename") or os.path.basename(
+                            stored_path
+                        )
+                        if stored_filename in wanted_names:
+                            name_buckets.setdefault(stored_filename, []).append(entry)
 
-            if not isinstance(results["ids"], list) or not isinstance(results["metadatas"], list):
-                return {"status": "error", "file_path": file_path, "message": "Invalid data types in results"}
+            # Chunks owned by an exact path match are reserved so a basename
+            # fallback for a different input cannot delete them.
+            exact_chunk_ids = {
+                entry[0] for entries in path_buckets.values() for entry in entries
+            }
+
+            per_file_results: List[Dict[str, Any]] = []
+            files_deleted = 0
+            chunks_deleted = 0
+            deleted_chunk_ids: set = set()
+            deleted_doc_ids: set = set()
+
+            for original_path, normalized_path in wanted.items():
+                if normalized_path in path_buckets:
+                    entries = [
+                        e for e in path_buckets[normalized_path]
+                        if e[0] not in deleted_chunk_ids
+                    ]
+                else:
+                    filename = _cached_basename(original_path)
+                    entries = [
+                        e for e in name_buckets.get(filename, [])
+                        if e[0] not in exact_chunk_ids and e[0] not in deleted_chunk_ids
+                    ]
+
+                if not entries:
+                    per_file_results.append(
+                        {
+                            "status": "not_found",
+                            "file_path": original_path,
+                            "message": f"No document found with file path or filename: {original_path}",
+                        }
+                    )
+                    continue
+
+                chunk_ids = [entry[0] for entry in entries]
+                doc_ids = {entry[1] for entry in entries}
+                self._delete_ids_batched(chunk_ids)
+                deleted_chunk_ids.update(chunk_ids)
+                deleted_doc_ids.update(doc_ids)
+                files_deleted += 1
+                chunks_deleted += len(chunk_ids)
+                per_file_results.append(
+                    {
+                        "status": "success",
+                        "file_path": original_path,
+                        "document_ids": sorted(doc_ids),
+                        "chunks_deleted": len(chunk_ids),
+                        "message": f"Document successfully deleted with {len(chunk_ids)} chunks",
+                    }
+                )
 
-            document_ids = list({m.get("document_id", "unknown") for m in results["metadatas"]})
+            if deleted_doc_ids:
+                if self._known_doc_ids is not None:
+                    self._known_doc_ids.difference_update(deleted_doc_ids)
+                self._manifest_forget(deleted_doc_ids)
+                self._doc_counts_record_delete(deleted_doc_ids)
+                self._path_index_forget_docs(deleted_doc_ids)
+                self._mark_collection_mutated()
 
-            self.collection.delete(ids=results["ids"])
             self.logger.info(
-                f"Successfully deleted document {file_path} with {len(results['ids'])} chunks"
+                "Batch delete removed %d chunks across %d files", chunks_deleted, files_deleted
             )
-
             return {
                 "status": "success",
-                "file_path": file_path,
-                "document_ids": document_ids,
-                "chunks_deleted": len(results["ids"]),
-                "message": f"Document successfully deleted with {len(results['ids'])} chunks",
+                "files_deleted": files_deleted,
+                "chunks_deleted": chunks_deleted,
+                "results": per_file_results,
             }
 
         except Exception as e:
-            self.logger.error(f"Failed to delete document by file path {file_path}: {str(e)}")
+            self.logger.error("Failed to batch-delete documents by file path: %s", str(e))
             raise
 
     # --------------------------------------------------------------------------
@@ -729,11 +2052,132 @@ class RAGControlService:
         """
         Return collection stats: total chunks, unique documents, total bytes, etc.
         (For the active collection only.)
+
+        Concurrent callers are coalesced: if a stats computation is already
+        in flight (e.g. a dashboard refreshing from several threads), new
+        callers wait on its result instead of starting their own scan.
         """
+        with self._stats_lock:
+            inflight = self._stats_inflight
+            if inflight is None:
+                inflight = concurrent.futures.Future()
+                self._stats_inflight = inflight
+                is_owner = True
+            else:
+                is_owner = False
+
+        if not is_owner:
+            return inflight.result()
+
         try:
+            stats = self._compute_database_stats()
+            inflight.set_result(stats)
+            return stats
+        except Exception as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._stats_lock:
+                self._stats_inflight = None
+
+    def _stats_via_sql(self, total_chunks: int) -> Optional[Dict[str, Any]]:
+        """
+        Aggregate unique-document and content-size stats with one SQL pass
+        over Chroma's backing chroma.sqlite3, instead of shipping every
+        metadata dict into Python and folding there.
+
+        Strictly read-only and best-effort: any schema mismatch (older or
+        newer Chroma layouts) returns None and the caller falls back to
+        the metadata scan.
+        """
+        db_file = os.path.join(self.db_path, "chroma.sqlite3")
+        if not os.path.exists(db_file):
+            return None
+        try:
+            conn = sqlite3.connect(f"file:{db_file}?mode=ro", uri=True)
             try:
-                _ = self.collection.get(limit=1)
-                results = self.collection.get()
+                # Scope the aggregation to this collection's metadata
+                # segment so side-by-side embedding collections do not
+                # pollute each other's counts.
+                row = conn.execute(
+                    "SELECT s.id FROM segments s "
+                    "JOIN collections c ON s.collection = c.id "
+                    "WHERE c.name = ? AND s.scope = 'METADATA'",
+                    (self.collection_name,),
+                ).fetchone()
+                if row is None:
+                    return None
+                segment_id = row[0]
+                unique_documents = conn.execute(
+                    "SELECT COUNT(DISTINCT em.string_value) "
+                    "FROM embedding_metadata em "
+                    "JOIN embeddings e ON e.id = em.id "
+                    "WHERE em.key = 'document_id' AND e.segment_id = ?",
+                    (segment_id,),
+                ).fetchone()[0]
+                # Legacy chunks (ingested before chunk_chars existed) have
+                # no size metadata, and SUM over the missing key would
+                # silently report 0. Only trust chunk_chars when every
+                # chunk carries it; otherwise sum the stored chunk bodies,
+                # matching what the Python fallback computes.
+                size_rows = conn.execute(
+                    "SELECT COUNT(*) "
+                    "FROM embedding_metadata em "
+                    "JOIN embeddings e ON e.id = em.id "
+                    "WHERE em.key = 'chunk_chars' AND e.segment_id = ?",
+                    (segment_id,),
+                ).fetchone()[0]
+                if size_rows == total_chunks:
+                    total_content_size = conn.execute(
+                        "SELECT COALESCE(SUM(em.int_value), 0) "
+                        "FROM embedding_metadata em "
+                        "JOIN embeddings e ON e.id = em.id "
+                        "WHERE em.key = 'chunk_chars' AND e.segment_id = ?",
+                        (segment_id,),
+                    ).fetchone()[0]
+                else:
+                    total_content_size = conn.execute(
+                        "SELECT COALESCE(SUM(LENGTH(em.string_value)), 0) "
+                        "FROM embedding_metadata em "
+                        "JOIN embeddings e ON e.id = em.id "
+                        "WHERE em.key = 'chroma:document' AND e.segment_id = ?",
+                        (segment_id,),
+                    ).fetchone()[0]
+            finally:
+                conn.close()
+
+            # A populated collection must report at least one document;
+            # zero here means the schema assumptions did not hold.
+            if total_chunks > 0 and unique_documents == 0:
+                return None
+
+            return {
+                "total_chunks": total_chunks,
+                "unique_documents": unique_documents,
+                "total_content_size_bytes": total_content_size,
+                "database_path": self.db_path,
+                "collection_name": self.collection_name,
+                "embedding_method": self.embedding_method,
+            }
+        except Exception as e:
+            self.logger.debug("SQL stats fast path unavailable: %s", str(e))
+            return None
+
+    def _compute_database_stats(self) -> Dict[str, Any]:
+        """Do the actual stats computation (see get_database_stats)."""
+        try:
+            # Version-keyed cache: any ingest/delete bumps the collection
+            # version, so a matching cached entry is still accurate and the
+            # scan below can be skipped entirely.
+            cached = self._stats_cache
+            if cached is not None and cached[0] == self._collection_version:
+                return dict(cached[1])
+
+            # Chunk count comes straight from SQLite COUNT(*): no ID list is
+            # serialized into Python, and an empty collection short-circuits
+            # before any metadata is fetched.
+            try:
+                total_chunks = self.collection.count()
             except Exception as e:
                 self.logger.error(f"Error calling collection methods: {str(e)}")
                 return {
@@ -745,13 +2189,7 @@ class RAGControlService:
                     "embedding_method": self.embedding_method,
                 }
 
-            if (
-                not results
-                or not isinstance(results, dict)
-                or "ids" not in results
-                or "metadatas" not in results
-                or "documents" not in results
-            ):
+            if total_chunks == 0:
                 return {
                     "total_chunks": 0,
                     "unique_documents": 0,
@@ -761,33 +2199,95 @@ class RAGControlService:
                     "embedding_method": self.embedding_method,
                 }
 
-            if (
-                not isinstance(results["ids"], list)
-                or not isinstance(results["metadatas"], list)
-                or not isinstance(results["documents"], list)
-            ):
-                return {
-                    "total_chunks": 0,
-                    "unique_documents": 0,
-                    "total_content_size_bytes": 0,
+            # If the per-document counter sidecar is authoritative, the
+            # remaining stats are O(num_documents) sums — no scan at all.
+            if self._doc_chunk_counts is not None:
+                stats = {
+                    "total_chunks": total_chunks,
+                    "unique_documents": len(self._doc_chunk_counts),
+                    "total_content_size_bytes": sum(
+                        entry.get("chars", 0) for entry in self._doc_chunk_counts.values()
+                    ),
                     "database_path": self.db_path,
                     "collection_name": self.collection_name,
                     "embedding_method": self.embedding_method,
                 }
-
-            if len(results["ids"]) == 0:
+                self._stats_cache = (self._collection_version, dict(stats))
+                self.logger.info("Database stats: %s", stats)
+                return stats
+
+            # Legacy collections without the counter sidecar: try a single
+            # SQL aggregation against the backing database before paying
+            # for a Python-side metadata fold.
+            sql_stats = self._stats_via_sql(total_chunks)
+            if sql_stats is not None:
+                self._stats_cache = (self._collection_version, dict(sql_stats))
+                self.logger.info("Database stats: %s", sql_stats)
+                return sql_stats
+
+            # The remaining stats need metadata: per-chunk character counts
+            # are written at ingest time, so the chunk bodies (and
+            # embeddings) never have to cross into Python. The scan pages
+            # with limit/offset so memory stays O(_SCAN_PAGE) rather than
+            # the whole collection; all reductions fold into one pass, and
+            # per-document tallies are kept so the counter sidecar can be
+            # rebuilt from this scan, making future stats calls O(1).
+            per_doc: Dict[str, Dict[str, int]] = {}
+            total_content_size = 0
+            missing_size_field = False
+            offset = 0
+            try:
+                while True:
+                    page = _ChromaResult.from_raw(
+                        self.collection.get(
+                            limit=_SCAN_PAGE, offset=offset, include=["metadatas"]
+                        )
+                    )
+                    if page is None or len(page.ids) == 0:
+                        break
+                    # Bound-method hoist: one attribute lookup for the whole
+                    # page instead of one per row.
+                    fold = per_doc.setdefault
+                    for meta in page.metadatas:
+                        doc_id = meta.get("document_id")
+                        entry = fold(
+                            doc_id if doc_id is not None else "unknown",
+                            {"chunks": 0, "chars": 0},
+                        )
+                        entry["chunks"] += 1
+                        size = meta.get("chunk_chars")
+                        if size is None:
+                            missing_size_field = True
+                        else:
+                            entry["chars"] += size
+                            total_content_size += size
+                    if len(page.ids) < _SCAN_PAGE:
+                        break
+                    offset += _SCAN_PAGE
+            except Exception as e:
+                self.logger.error(f"Error calling collection methods: {str(e)}")
                 return {
-                    "total_chunks": 0,
+                    "total_chunks": total_chunks,
                     "unique_documents": 0,
                     "total_content_size_bytes": 0,
                     "database_path": self.db_path,
                     "collection_name": self.collection_name,
                     "embedding_method": self.embedding_method,
                 }
+            # Chunks missing a document_id land in the "unknown" bucket for
+            # the sidecar but no longer inflate the unique-document count.
+            unique_documents = len(per_doc) - ("unknown" in per_doc)
+
+            if not missing_size_field:
+                self._doc_chunk_counts = per_doc
+                self._save_doc_counts()
 
-            total_chunks = len(results["ids"])
-            unique_documents = len({m.get("document_id", "unknown") for m in results["metadatas"]})
-            total_content_size = sum(len(doc) for doc in results["documents"])
+            # Legacy chunks (ingested before chunk_chars existed) report no
+            # size; fall back to one documents fetch only in that case.
+            if total_content_size == 0 and missing_size_field:
+                docs = _ChromaResult.from_raw(self.collection.get(include=["documents"]))
+                if docs is not None:
+                    total_content_size = sum(len(doc) for doc in docs.documents)
 
             stats = {
                 "total_chunks": total_chunks,
@@ -797,11 +2297,12 @@ class RAGControlService:
                 "collection_name": self.collection_name,
                 "embedding_method": self.embedding_method,
             }
-            self.logger.info(f"Database stats: {stats}")
+            self._stats_cache = (self._collection_version, dict(stats))
+            self.logger.info("Database stats: %s", stats)
             return stats
 
         except Exception as e:
-            self.logger.error(f"Failed to get database stats: {str(e)}")
+            self.logger.error("Failed to get database stats: %s", str(e))
             raise
 
 
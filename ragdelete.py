@@ -10,16 +10,18 @@ Version: 1.0.0
 """
 
 import os
+import stat
 import sys
 import logging
 import argparse
 from typing import Dict, Any, Optional, List
 from pathlib import Path
 from datetime import datetime
-import traceback
 
-# Import the RAGService class
-from ragcontrolservice import RAGService
+# RAGService is imported lazily inside RAGDelete.__init__: pulling in
+# ragcontrolservice loads chromadb/numpy/pdfplumber, which costs seconds
+# of startup that --help should never pay. traceback is likewise imported
+# only in the error paths that format it.
 
 
 class RAGDelete:
@@ -42,47 +44,68 @@ class RAGDelete:
         self.log_level = log_level
         self.setup_logging()
         self.logger = logging.getLogger(__name__)
+        # Cached once: os.path.abspath re-reads the cwd (a syscall) on every
+        # call, which adds up when normalizing paths across large batches.
+        self._cwd = os.getcwd()
         
         try:
+            # Deferred import: see the note at the top of the file.
+            from ragcontrolservice import RAGService
+
             # Initialize RAGService instance
             self.rag_control = RAGService(db_path=db_path)
-            self.logger.info(f"RAGDelete initialized successfully with database at {db_path}")
-            
+
+            # Lazily-built lookup dicts over the stored documents; None
+            # means "stale" and the next existence check rebuilds them.
+            self._by_abspath: Optional[Dict[str, Dict[str, Any]]] = None
+            self._by_basename: Optional[Dict[str, Dict[str, Any]]] = None
+
+            self.logger.info("RAGDelete initialized successfully with database at %s", db_path)
+
         except Exception as e:
-            self.logger.error(f"Failed to initialize RAGDelete: {str(e)}")
+            self.logger.error("Failed to initialize RAGDelete: %s", str(e))
             raise RuntimeError(f"RAGDelete initialization failed: {str(e)}")
     
     def setup_logging(self):
-        """Setup comprehensive logging configuration for RAGDelete."""
+        """Setup comprehensive logging configuration for RAGDelete.
+
+        Idempotent: the root logger is configured at most once per process,
+        so constructing several RAGDelete instances (batch scripts, tests)
+        does not stack duplicate handlers and amplify every log line.
+        """
+        root = logging.getLogger()
+        if getattr(root, "_ragdelete_configured", False):
+            return
+
         # Create logs directory if it doesn't exist
         os.makedirs("logs", exist_ok=True)
-        
+
         # Configure logging
         log_level = getattr(logging, self.log_level.upper(), logging.INFO)
-        
+
         # Create formatter
         formatter = logging.Formatter(
             '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
             datefmt='%Y-%m-%d %H:%M:%S'
         )
-        
+
         # Setup file handler
         log_file = f"logs/rag_delete_{datetime.now().strftime('%Y%m%d')}.log"
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
         file_handler.setLevel(log_level)
         file_handler.setFormatter(formatter)
-        
+
         # Setup console handler
         console_handler = logging.StreamHandler(sys.stdout)
         console_handler.setLevel(log_level)
         console_handler.setFormatter(formatter)
-        
-        # Setup root logger
-        logging.basicConfig(
-            level=log_level,
-            handlers=[file_handler, console_handler],
-            format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-        )
+
+        # Setup root logger directly (basicConfig silently no-ops once any
+        # handler is installed, which previously made reconfiguration racy)
+        root.setLevel(log_level)
+        root.addHandler(file_handler)
+        root.addHandler(console_handler)
+        root._ragdelete_configured = True
     
     def validate_file_path(self, file_path: str) -> str:
         """
@@ -99,91 +122,137 @@ class RAGDelete:
             FileNotFoundError: If file doesn't exist
         """
         try:
-            if not file_path or not file_path.strip():
+            stripped = file_path.strip() if file_path else ""
+            if not stripped:
                 raise ValueError("File path cannot be empty")
-            
-            # Normalize and get absolute path
-            normalized_path = os.path.abspath(file_path.strip())
-            
-            # Check if file exists
-            if not os.path.exists(normalized_path):
-                raise FileNotFoundError(f"File not found: {normalized_path}")
-            
-            # Check if it's a file (not directory)
-            if not os.path.isfile(normalized_path):
+
+            # Normalize against the cached cwd; strip happened once above.
+            normalized_path = self._normalize_path(stripped)
+
+            # One stat() answers both existence and file-vs-directory;
+            # the old exists/isfile pair cost two syscalls for the same.
+            try:
+                st = os.stat(normalized_path)
+            except FileNotFoundError:
+                raise FileNotFoundError(f"File not found: {normalized_path}") from None
+            if not stat.S_ISREG(st.st_mode):
                 raise ValueError(f"Path is not a file: {normalized_path}")
-            
+
             # Validate file extension
-            file_ext = os.path.splitext(normalized_path)[1].lower()
-            if file_ext not in ['.md', '.pdf']:
-                raise ValueError(f"Unsupported file type: {file_ext}. Only .md and .pdf files are supported.")
+            self._check_extension(normalized_path)
             
-            self.logger.info(f"File path validated successfully: {normalized_path}")
+            self.logger.info("File path validated successfully: %s", normalized_path)
             return normalized_path
             
         except Exception as e:
-            self.logger.error(f"File path validation failed for {file_path}: {str(e)}")
+            self.logger.error("File path validation failed for %s: %s", file_path, str(e))
             raise
     
+    def _check_extension(self, normalized_path: str) -> None:
+        """Raise ValueError unless the path ends in a supported extension."""
+        # rpartition avoids splitext's tuple allocation on this hot path.
+        head, _, tail = normalized_path.rpartition('.')
+        file_ext = f".{tail.lower()}" if head else ""
+        if file_ext not in ('.md', '.pdf'):
+            raise ValueError(f"Unsupported file type: {file_ext}. Only .md and .pdf files are supported.")
+
+    def _build_doc_index(self) -> None:
+        """
+        Build O(1) lookup dicts over the stored documents from a single
+        list_documents() call: one keyed by absolute path, one by basename.
+        Existence checks then cost two dict lookups instead of scanning
+        (and re-normalizing) the whole document list per file.
+        """
+        list_result = self.rag_control.list_documents()
+
+        if list_result["status"] != "success":
+            raise RuntimeError("Failed to list documents from database")
+
+        by_abspath: Dict[str, Dict[str, Any]] = {}
+        by_basename: Dict[str, Dict[str, Any]] = {}
+        for doc in list_result["documents"]:
+            stored_path = self._normalize_path(doc["file_path"])
+            by_abspath[stored_path] = doc
+            # First wins on basename collisions, matching the old scan order.
+            by_basename.setdefault(os.path.basename(stored_path), doc)
+
+        self._by_abspath = by_abspath
+        self._by_basename = by_basename
+        self.logger.info("Built document index with %d documents", len(by_abspath))
+
+    def _normalize_path(self, path: str) -> str:
+        """
+        Absolutize a path against the cached cwd without the per-call
+        getcwd syscall that os.path.abspath performs.
+        """
+        if os.path.isabs(path):
+            return os.path.normpath(path)
+        return os.path.normpath(os.path.join(self._cwd, path))
+
+    def _invalidate_doc_index(self) -> None:
+        """Mark the lookup dicts stale after any deletion."""
+        self._by_abspath = None
+        self._by_basename = None
+
     def check_document_exists(self, file_path: str) -> Dict[str, Any]:
         """
         Check if a document exists in the database.
-        
+
         Args:
             file_path (str): File path to check
-            
+
         Returns:
             Dict[str, Any]: Document existence check results
         """
         try:
-            self.logger.info(f"Checking if document exists in database: {file_path}")
-            
-            # Get all documents from database
-            list_result = self.rag_control.list_documents()
-            
-            if list_result["status"] != "success":
-                raise RuntimeError("Failed to list documents from database")
-            
-            # Normalize the input file path for comparison
-            normalized_input_path = os.path.abspath(file_path)
-            
-            # Check if file path exists in any document
-            for doc in list_result["documents"]:
-                # Normalize the stored file path for comparison
-                stored_path = os.path.abspath(doc["file_path"])
-                
-                if stored_path == normalized_input_path:
-                    self.logger.info(f"Document found in database: {file_path}")
-                    return {
-                        "exists": True,
-                        "document_id": doc["document_id"],
-                        "file_type": doc["file_type"],
-                        "total_chunks": doc["total_chunks"],
-                        "timestamp": doc["timestamp"]
-                    }
-            
-            # If exact match not found, try matching by filename
-            input_filename = os.path.basename(file_path)
-            for doc in list_result["documents"]:
-                stored_filename = os.path.basename(doc["file_path"])
-                if stored_filename == input_filename:
-                    self.logger.info(f"Document found in database by filename: {input_filename}")
-                    return {
-                        "exists": True,
-                        "document_id": doc["document_id"],
-                        "file_type": doc["file_type"],
-                        "total_chunks": doc["total_chunks"],
-                        "timestamp": doc["timestamp"]
-                    }
-            
-            self.logger.info(f"Document not found in database: {file_path}")
+            self.logger.info("Checking if document exists in database: %s", file_path)
+
+            normalized_input_path = self._normalize_path(file_path)
+
+            # Sidecar fast path: the service's persistent path index can
+            # answer without scanning the collection on a cold start.
+            indexed = self.rag_control.find_document_by_path(normalized_input_path)
+            if indexed is not None:
+                self.logger.info("Document found via path index: %s", file_path)
+                return {
+                    "exists": True,
+                    "document_id": indexed["document_id"],
+                    "file_type": indexed["file_type"],
+                    "total_chunks": indexed["total_chunks"],
+                    "timestamp": indexed["timestamp"]
+                }
+
+            # Build (or reuse) the lookup index — one list_documents() call
+            # serves any number of checks until the next deletion.
+            if self._by_abspath is None or self._by_basename is None:
+                self._build_doc_index()
+
+            # Exact path first, then filename fallback — two dict lookups.
+            doc = self._by_abspath.get(normalized_input_path)
+            if doc is None:
+                doc = self._by_basename.get(os.path.basename(file_path))
+                if doc is not None:
+                    self.logger.info("Document found in database by filename: %s", os.path.basename(file_path))
+            else:
+                self.logger.info("Document found in database: %s", file_path)
+
+            if doc is not None:
+                return {
+                    "exists": True,
+                    "document_id": doc["document_id"],
+                    "file_type": doc["file_type"],
+                    "total_chunks": doc["total_chunks"],
+                    "timestamp": doc["timestamp"]
+                }
+
+            self.logger.info("Document not found in database: %s", file_path)
             return {
                 "exists": False,
                 "file_path": file_path
             }
-            
+
         except Exception as e:
-            self.logger.error(f"Failed to check document existence for {file_path}: {str(e)}")
+            self.logger.error("Failed to check document existence for %s: %s", file_path, str(e))
             raise
     
     def delete_document(self, file_path: str, force: bool = False) -> Dict[str, Any]:
@@ -198,15 +267,27 @@ class RAGDelete:
             Dict[str, Any]: Deletion results
         """
         try:
-            self.logger.info(f"Starting document deletion process: {file_path}")
-            
-            # Validate file path
-            validated_path = self.validate_file_path(file_path)
-            
-            # Check if document exists in database
+            self.logger.info("Starting document deletion process: %s", file_path)
+
+            # DB-first lookup: the common case is purging a document whose
+            # file has already been removed from disk, and requiring an
+            # on-disk stat up front made that impossible. Consult the
+            # database index first; known documents only need their
+            # extension checked, never a filesystem probe.
+            stripped = file_path.strip() if file_path else ""
+            if not stripped:
+                raise ValueError("File path cannot be empty")
+            validated_path = self._normalize_path(stripped)
+
             existence_check = self.check_document_exists(validated_path)
-            
-            if not existence_check["exists"]:
+
+            if existence_check["exists"]:
+                self._check_extension(validated_path)
+            else:
+                # Unknown to the DB: run the full on-disk validation so
+                # the caller gets a precise error (missing file, directory,
+                # unsupported type) before the not-found answer.
+                validated_path = self.validate_file_path(file_path)
                 return {
                     "status": "not_found",
                     "file_path": validated_path,
@@ -215,9 +296,10 @@ class RAGDelete:
                 }
             
             # Log document details
-            self.logger.info(f"Document found - ID: {existence_check['document_id']}, "
-                           f"Type: {existence_check['file_type']}, "
-                           f"Chunks: {existence_check['total_chunks']}")
+            self.logger.info("Document found - ID: %s, Type: %s, Chunks: %s",
+                             existence_check['document_id'],
+                             existence_check['file_type'],
+                             existence_check['total_chunks'])
             
             # Confirm deletion unless forced
             if not force:
@@ -229,7 +311,7 @@ class RAGDelete:
                 
                 confirm = input("\nAre you sure you want to delete this document? (y/N): ").strip().lower()
                 if confirm not in ['y', 'yes']:
-                    self.logger.info(f"Document deletion cancelled by user: {validated_path}")
+                    self.logger.info("Document deletion cancelled by user: %s", validated_path)
                     return {
                         "status": "cancelled",
                         "file_path": validated_path,
@@ -237,11 +319,15 @@ class RAGDelete:
                         "timestamp": datetime.now().isoformat()
                     }
             
-            # Perform deletion using RAGService
-            deletion_result = self.rag_control.delete_document_by_file_path(validated_path)
+            # Perform deletion using RAGService (this CLI reports the deleted
+            # document_ids, so opt in to having them materialized)
+            deletion_result = self.rag_control.delete_document_by_file_path(
+                validated_path, include_document_ids=True
+            )
             
             if deletion_result["status"] == "success":
-                self.logger.info(f"Document successfully deleted: {validated_path}")
+                self.logger.info("Document successfully deleted: %s", validated_path)
+                self._invalidate_doc_index()
                 return {
                     "status": "success",
                     "file_path": validated_path,
@@ -251,13 +337,16 @@ class RAGDelete:
                     "timestamp": datetime.now().isoformat()
                 }
             else:
-                self.logger.warning(f"Document deletion returned unexpected status: {deletion_result}")
+                self.logger.warning("Document deletion returned unexpected status: %s", deletion_result)
                 return deletion_result
             
         except Exception as e:
+            import traceback
+
             error_msg = f"Failed to delete document {file_path}: {str(e)}"
             self.logger.error(error_msg)
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
             
             return {
                 "status": "error",
@@ -279,8 +368,8 @@ class RAGDelete:
             Dict[str, Any]: Batch deletion results
         """
         try:
-            self.logger.info(f"Starting batch deletion of {len(file_paths)} documents")
-            
+            self.logger.info("Starting batch deletion of %d documents", len(file_paths))
+
             results = {
                 "status": "batch_completed",
                 "total_files": len(file_paths),
@@ -291,45 +380,116 @@ class RAGDelete:
                 "results": [],
                 "timestamp": datetime.now().isoformat()
             }
-            
-            for file_path in file_paths:
+
+            # Validate every path up front; invalid ones become error
+            # entries without blocking the rest of the batch. Validation
+            # is stat-bound and os.stat releases the GIL, so large batches
+            # fan out over a thread pool; small ones stay serial.
+            def _validate(file_path: str):
                 try:
-                    result = self.delete_document(file_path, force=force)
-                    results["results"].append(result)
-                    
-                    if result["status"] == "success":
-                        results["successful_deletions"] += 1
-                    elif result["status"] == "not_found":
-                        results["not_found"] += 1
-                    elif result["status"] == "cancelled":
-                        results["cancelled"] += 1
-                    else:
-                        results["failed_deletions"] += 1
-                        
+                    return file_path, self.validate_file_path(file_path), None
                 except Exception as e:
-                    error_result = {
+                    return file_path, None, e
+
+            if len(file_paths) > 8:
+                from concurrent.futures import ThreadPoolExecutor
+
+                with ThreadPoolExecutor(
+                    max_workers=16, thread_name_prefix="rag-validate"
+                ) as executor:
+                    validations = list(executor.map(_validate, file_paths))
+            else:
+                validations = [_validate(p) for p in file_paths]
+
+            valid_paths: List[str] = []
+            for file_path, validated_path, error in validations:
+                if error is None:
+                    valid_paths.append(validated_path)
+                else:
+                    results["results"].append({
                         "status": "error",
                         "file_path": file_path,
-                        "error": str(e),
-                        "message": f"Unexpected error during deletion: {str(e)}",
+                        "error": str(error),
+                        "message": f"Validation failed: {str(error)}",
                         "timestamp": datetime.now().isoformat()
-                    }
-                    results["results"].append(error_result)
+                    })
                     results["failed_deletions"] += 1
-                    self.logger.error(f"Unexpected error deleting {file_path}: {str(e)}")
-            
-            self.logger.info(f"Batch deletion completed - "
-                           f"Success: {results['successful_deletions']}, "
-                           f"Failed: {results['failed_deletions']}, "
-                           f"Not Found: {results['not_found']}, "
-                           f"Cancelled: {results['cancelled']}")
-            
+
+            # Interactive mode: resolve everything against the document
+            # index, show one summary table, and ask a single y/N for the
+            # whole batch instead of one prompt (and one scan) per file.
+            if not force and valid_paths:
+                found: List[tuple] = []
+                remaining: List[str] = []
+                for validated_path in valid_paths:
+                    existence_check = self.check_document_exists(validated_path)
+                    if existence_check["exists"]:
+                        found.append((validated_path, existence_check))
+                        remaining.append(validated_path)
+                    else:
+                        results["results"].append({
+                            "status": "not_found",
+                            "file_path": validated_path,
+                            "message": f"Document not found in database: {validated_path}",
+                            "timestamp": datetime.now().isoformat()
+                        })
+                        results["not_found"] += 1
+
+                if found:
+                    print(f"\nDocuments to be deleted ({len(found)}):")
+                    for validated_path, info in found:
+                        print(f"  {validated_path} ({info['file_type']}) - "
+                              f"{info['total_chunks']} chunks, added {info['timestamp']}")
+
+                    confirm = input(
+                        f"\nAre you sure you want to delete these {len(found)} documents? (y/N): "
+                    ).strip().lower()
+                    if confirm not in ['y', 'yes']:
+                        self.logger.info("Batch deletion cancelled by user")
+                        for validated_path, _ in found:
+                            results["results"].append({
+                                "status": "cancelled",
+                                "file_path": validated_path,
+                                "message": "Deletion cancelled by user",
+                                "timestamp": datetime.now().isoformat()
+                            })
+                            results["cancelled"] += 1
+                        return results
+
+                valid_paths = remaining
+
+            # One batched service call resolves and deletes every confirmed
+            # file with a single metadata pass.
+            if valid_paths:
+                batch_result = self.rag_control.delete_documents_by_file_paths(valid_paths)
+                for res in batch_result["results"]:
+                    entry = dict(res)
+                    entry["timestamp"] = datetime.now().isoformat()
+                    results["results"].append(entry)
+                    if res["status"] == "success":
+                        results["successful_deletions"] += 1
+                    elif res["status"] == "not_found":
+                        results["not_found"] += 1
+                    else:
+                        results["failed_deletions"] += 1
+                self._invalidate_doc_index()
+
+            self.logger.info("Batch deletion completed - "
+                             "Success: %d, Failed: %d, Not Found: %d, Cancelled: %d",
+                             results['successful_deletions'],
+                             results['failed_deletions'],
+                             results['not_found'],
+                             results['cancelled'])
+
             return results
             
         except Exception as e:
+            import traceback
+
             error_msg = f"Failed to perform batch deletion: {str(e)}"
             self.logger.error(error_msg)
-            self.logger.debug(f"Full traceback: {traceback.format_exc()}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Full traceback: %s", traceback.format_exc())
             
             return {
                 "status": "error",
@@ -348,11 +508,11 @@ class RAGDelete:
         try:
             self.logger.info("Retrieving database statistics")
             stats = self.rag_control.get_database_stats()
-            self.logger.info(f"Database stats retrieved successfully")
+            self.logger.info("Database stats retrieved successfully")
             return stats
             
         except Exception as e:
-            self.logger.error(f"Failed to get database stats: {str(e)}")
+            self.logger.error("Failed to get database stats: %s", str(e))
             raise
     
     def list_documents(self) -> Dict[str, Any]:
@@ -365,11 +525,11 @@ class RAGDelete:
         try:
             self.logger.info("Listing all documents in database")
             documents = self.rag_control.list_documents()
-            self.logger.info(f"Successfully listed {documents['documents_count']} documents")
+            self.logger.info("Successfully listed %d documents", documents['documents_count'])
             return documents
             
         except Exception as e:
-            self.logger.error(f"Failed to list documents: {str(e)}")
+            self.logger.error("Failed to list documents: %s", str(e))
             raise
 
 
@@ -491,6 +651,8 @@ Examples:
     except Exception as e:
         print(f"\nError: {str(e)}")
         if args.verbose:
+            import traceback
+
             traceback.print_exc()
         sys.exit(1)
 
@@ -13,14 +13,30 @@ import os
 import sys
 from typing import Optional, Dict, Any, List
 
-# Your service with pluggable embeddings (alias kept as RAGService)
-from ragcontrolservice import RAGService
+# JSON serializer: orjson (C, SIMD) when installed, stdlib otherwise.
+# Output stays ASCII-unescaped and 2-space indented in both cases.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+# Snippet sanitizer: one C-level translate call replaces the chained
+# .replace() allocations when flattening newlines for display.
+_NL_TABLE = str.maketrans({"\n": " ", "\r": " ", "\t": " "})
+
+# The service import is deferred to initialize_rag_control: pulling in
+# ragcontrolservice loads chromadb and the embedding stacks, which costs
+# seconds of startup that --help and argparse errors should never pay.
 
 
 class RAGQuery:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.rag_control: Optional[RAGService] = None
+        self.rag_control: Optional["RAGService"] = None
 
     def initialize_rag_control(
         self,
@@ -29,14 +45,19 @@ class RAGQuery:
         sentence_model_name: str = "all-MiniLM-L6-v2",
         openai_model_name: str = "text-embedding-3-small",
         openai_api_key: Optional[str] = None,
+        sentence_fp16: bool = False,
     ) -> bool:
         """
         Initialize the RAG service with the selected embedding method so that
         we query the correct per-embedding collection.
         """
         try:
+            # Deferred import: see the note at the top of the file.
+            from ragcontrolservice import RAGService
+
             self.logger.info(
-                f"Initializing RAGService at '{db_path}' with embedding '{embedding_method}'"
+                "Initializing RAGService at '%s' with embedding '%s'",
+                db_path, embedding_method,
             )
             self.rag_control = RAGService(
                 db_path=db_path,
@@ -44,10 +65,11 @@ class RAGQuery:
                 sentence_model_name=sentence_model_name,
                 openai_model_name=openai_model_name,
                 openai_api_key=openai_api_key,  # service will also read env if None
+                sentence_fp16=sentence_fp16,
             )
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize RAGService: {str(e)}")
+            self.logger.error("Failed to initialize RAGService: %s", str(e))
             return False
 
     def search(
@@ -66,11 +88,41 @@ class RAGQuery:
             n_results=n_results,
         )
 
+    def search_batch(
+        self,
+        queries: List[str],
+        document_filter: Optional[str] = None,
+        n_results: int = 5,
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several queries as one multi-vector search (one embedding pass,
+        one Chroma call); results keep the order of `queries`.
+        """
+        assert self.rag_control is not None, "RAG service not initialized"
+        return self.rag_control.search_documents_batch(
+            queries=queries,
+            document_filter=document_filter,
+            n_results=n_results,
+        )
+
+
+# Guards configure_logging so repeated calls (re-entry from an embedding
+# script, multiple RAGQuery lifecycles in one process) don't stack handlers.
+_LOGGING_CONFIGURED = False
+
 
 def configure_logging(verbosity: int):
     """
-    Configure logging level based on -v occurrences (0: WARNING, 1: INFO, 2+: DEBUG)
+    Configure logging level based on -v occurrences (0: WARNING, 1: INFO, 2+: DEBUG).
+
+    Idempotent: configures the root logger at most once per process and
+    defers to any handlers an embedding application installed first.
     """
+    global _LOGGING_CONFIGURED
+    if _LOGGING_CONFIGURED or logging.getLogger().hasHandlers():
+        return
+    _LOGGING_CONFIGURED = True
+
     if verbosity <= 0:
         level = logging.WARNING
     elif verbosity == 1:
@@ -90,10 +142,18 @@ def build_parser() -> argparse.ArgumentParser:
         description="RAG Query CLI - Query a Chroma collection with a chosen embedding method."
     )
 
-    # Positional: the query text
+    # Positional: the query text (optional when --queries-file is given)
     parser.add_argument(
         "query",
-        help="Search query text.",
+        nargs="?",
+        default=None,
+        help="Search query text (omit when using --queries-file).",
+    )
+    parser.add_argument(
+        "--queries-file",
+        dest="queries_file",
+        default=None,
+        help="Path to a text file with one query per line; all queries run as a single batch.",
     )
 
     # Embedding selection (matches study-side options)
@@ -144,6 +204,13 @@ def build_parser() -> argparse.ArgumentParser:
         default="text-embedding-3-small",
         help="OpenAI embedding model (default: text-embedding-3-small).",
     )
+    parser.add_argument(
+        "--compute-dtype",
+        dest="compute_dtype",
+        choices=["fp32", "fp16"],
+        default="fp32",
+        help="Embedding compute precision; fp16 is applied only on CUDA devices (default: fp32).",
+    )
 
     # Output & logging
     parser.add_argument(
@@ -164,26 +231,30 @@ def build_parser() -> argparse.ArgumentParser:
 
 
 def _print_human(results: Dict[str, Any]):
-    # Pretty, human-readable output
+    # Pretty, human-readable output. The report is assembled in memory and
+    # emitted with a single write: each print() would take the stdout lock,
+    # encode, and (on a TTY) flush per line — ~8 syscalls per hit.
     status = results.get("status")
     collection = results.get("collection_name")
     embedding = results.get("embedding_method")
     count = results.get("results_count", 0)
     query = results.get("query")
 
-    print("\n=== RAG Query Results ===")
-    print(f"Status     : {status}")
-    print(f"Query      : {query}")
-    print(f"Collection : {collection}")
-    print(f"Embedding  : {embedding}")
-    print(f"Matches    : {count}")
+    parts: List[str] = [
+        "\n=== RAG Query Results ===\n"
+        f"Status     : {status}\n"
+        f"Query      : {query}\n"
+        f"Collection : {collection}\n"
+        f"Embedding  : {embedding}\n"
+        f"Matches    : {count}\n"
+    ]
 
     items: List[Dict[str, Any]] = results.get("results", [])
     for idx, item in enumerate(items, start=1):
         chunk_id = item.get("chunk_id")
         distance = item.get("distance")
         content = item.get("content", "")
-        snippet = content[:200].replace("\n", " ") + ("..." if len(content) > 200 else "")
+        snippet = content[:200].translate(_NL_TABLE) + ("..." if len(content) > 200 else "")
 
         meta = item.get("metadata", {}) or {}
         doc_id = meta.get("document_id")
@@ -191,14 +262,18 @@ def _print_human(results: Dict[str, Any]):
         chunk_index = meta.get("chunk_index")
         total_chunks = meta.get("total_chunks")
 
-        print("\n---")
-        print(f"#{idx}  chunk_id   : {chunk_id}")
+        parts.append(f"\n---\n#{idx}  chunk_id   : {chunk_id}\n")
         if distance is not None:
-            print(f"    distance  : {distance:.6f}")
-        print(f"    document  : {doc_id}")
-        print(f"    file_path : {file_path}")
-        print(f"    chunk     : {chunk_index}/{total_chunks - 1 if isinstance(total_chunks, int) and total_chunks > 0 else '?'}")
-        print(f"    snippet   : {snippet}")
+            parts.append(f"    distance  : {distance:.6f}\n")
+        parts.append(
+            f"    document  : {doc_id}\n"
+            f"    file_path : {file_path}\n"
+            f"    chunk     : {chunk_index}/{total_chunks - 1 if isinstance(total_chunks, int) and total_chunks > 0 else '?'}\n"
+            f"    snippet   : {snippet}\n"
+        )
+
+    sys.stdout.write("".join(parts))
+    sys.stdout.flush()
 
 
 def main():
@@ -208,6 +283,21 @@ def main():
     configure_logging(args.verbosity)
     log = logging.getLogger("ragquery")
 
+    # Resolve the query source: a single positional query, or a batch file.
+    queries: Optional[List[str]] = None
+    if args.queries_file:
+        try:
+            with open(args.queries_file, "r", encoding="utf-8") as f:
+                queries = [line.strip() for line in f if line.strip()]
+        except OSError as e:
+            log.error("Could not read queries file: %s", e)
+            sys.exit(1)
+        if not queries:
+            log.error("Queries file is empty: %s", args.queries_file)
+            sys.exit(1)
+    elif args.query is None:
+        parser.error("a query is required (or use --queries-file)")
+
     # Initialize query controller
     rq = RAGQuery()
     ok = rq.initialize_rag_control(
@@ -216,6 +306,7 @@ def main():
         sentence_model_name=args.sentence_model_name,
         openai_model_name=args.openai_model_name,
         openai_api_key=args.openai_api_key,  # service will fall back to env if None
+        sentence_fp16=(args.compute_dtype == "fp16"),
     )
     if not ok:
         log.error("Failed to initialize RAG service.")
@@ -223,17 +314,29 @@ def main():
 
     # Execute search
     try:
-        results = rq.search(
-            query=args.query,
-            document_filter=args.document_filter,
-            n_results=args.n_results,
-        )
-        if args.json_output:
-            print(json.dumps(results, ensure_ascii=False, indent=2))
+        if queries is not None:
+            batch_results = rq.search_batch(
+                queries=queries,
+                document_filter=args.document_filter,
+                n_results=args.n_results,
+            )
+            if args.json_output:
+                print(_dumps(batch_results))
+            else:
+                for results in batch_results:
+                    _print_human(results)
         else:
-            _print_human(results)
+            results = rq.search(
+                query=args.query,
+                document_filter=args.document_filter,
+                n_results=args.n_results,
+            )
+            if args.json_output:
+                print(_dumps(results))
+            else:
+                _print_human(results)
     except Exception as e:
-        log.exception(f"Query failed: {e}")
+        log.exception("Query failed: %s", e)
         sys.exit(3)
 
 
@@ -13,14 +13,26 @@ import os
 import sys
 from typing import Optional
 
-# Your service with pluggable embeddings
-from ragcontrolservice import RAGService
+# JSON serializer: orjson (C, SIMD) when installed, stdlib otherwise.
+# Output stays ASCII-unescaped and 2-space indented in both cases.
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode("utf-8")
+except ImportError:
+    def _dumps(obj) -> str:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+
+# The service import is deferred to initialize_rag_control: pulling in
+# ragcontrolservice loads chromadb and the embedding stacks, which costs
+# seconds of startup that --help and argparse errors should never pay.
 
 
 class RAGStudy:
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
-        self.rag_control: Optional[RAGService] = None
+        self.rag_control: Optional["RAGService"] = None
 
     def initialize_rag_control(
         self,
@@ -29,13 +41,19 @@ class RAGStudy:
         sentence_model_name: str = "all-MiniLM-L6-v2",
         openai_model_name: str = "text-embedding-3-small",
         openai_api_key: Optional[str] = None,
+        sentence_fp16: bool = False,
+        embed_batch_size: Optional[int] = None,
     ) -> bool:
         """
         Initialize the RAG service with the selected embedding method.
         """
         try:
+            # Deferred import: see the note at the top of the file.
+            from ragcontrolservice import RAGService
+
             self.logger.info(
-                f"Initializing RAGService at '{db_path}' with embedding '{embedding_method}'"
+                "Initializing RAGService at '%s' with embedding '%s'",
+                db_path, embedding_method,
             )
             self.rag_control = RAGService(
                 db_path=db_path,
@@ -43,10 +61,12 @@ class RAGStudy:
                 sentence_model_name=sentence_model_name,
                 openai_model_name=openai_model_name,
                 openai_api_key=openai_api_key,  # if None, service will read from env
+                sentence_fp16=sentence_fp16,
+                embed_batch_size=embed_batch_size,
             )
             return True
         except Exception as e:
-            self.logger.error(f"Failed to initialize RAGService: {str(e)}")
+            self.logger.error("Failed to initialize RAGService: %s", str(e))
             return False
 
     def study_document(self, file_path: str, file_type: str) -> dict:
@@ -56,6 +76,15 @@ class RAGStudy:
         assert self.rag_control is not None, "RAG service not initialized"
         return self.rag_control.study_document(file_path=file_path, file_type=file_type)
 
+    def study_documents(self, file_paths: list, file_type: str) -> list:
+        """
+        Ingest several documents concurrently through the service's
+        threaded batch path (one model, parallel per-file extraction and
+        embedding); results keep the order of `file_paths`.
+        """
+        assert self.rag_control is not None, "RAG service not initialized"
+        return self.rag_control.study_documents(file_paths=file_paths, file_type=file_type)
+
 
 def configure_logging(verbosity: int):
     """
@@ -93,10 +122,20 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "file_path",
-        help="Path to the file to study.",
+        nargs="*",
+        default=[],
+        help="Path(s) to the file(s) to study; several files are ingested as one batch.",
     )
 
     # Optional args
+    parser.add_argument(
+        "--glob",
+        dest="glob_patterns",
+        action="append",
+        default=None,
+        metavar="PATTERN",
+        help="Glob pattern of files to study (repeatable), e.g. --glob 'docs/*.md'.",
+    )
     parser.add_argument(
         "--db",
         dest="db_path",
@@ -121,6 +160,20 @@ def build_parser() -> argparse.ArgumentParser:
         default="text-embedding-3-small",
         help="OpenAI embedding model (default: text-embedding-3-small).",
     )
+    parser.add_argument(
+        "--compute-dtype",
+        dest="compute_dtype",
+        choices=["fp32", "fp16"],
+        default="fp32",
+        help="Embedding compute precision; fp16 is applied only on CUDA devices (default: fp32).",
+    )
+    parser.add_argument(
+        "--embed-batch",
+        dest="embed_batch_size",
+        type=int,
+        default=None,
+        help="Texts per embedding call during ingest (default: 64 local, 2048 OpenAI).",
+    )
     parser.add_argument(
         "-v",
         dest="verbosity",
@@ -145,10 +198,32 @@ def main():
     configure_logging(args.verbosity)
     log = logging.getLogger("ragstudy")
 
-    # Validate file existence early
-    if not os.path.exists(args.file_path):
-        log.error(f"File not found: {args.file_path}")
-        sys.exit(1)
+    # Expand --glob patterns into the file list (sorted for deterministic
+    # order, deduplicated while preserving first occurrence).
+    file_paths = list(args.file_path)
+    if args.glob_patterns:
+        import glob as _glob
+
+        for pattern in args.glob_patterns:
+            matches = sorted(_glob.glob(pattern))
+            if not matches:
+                log.warning("Glob pattern matched no files: %s", pattern)
+            file_paths.extend(matches)
+        file_paths = list(dict.fromkeys(file_paths))
+    if not file_paths:
+        parser.error("no files to study (give file paths or --glob)")
+    args.file_path = file_paths
+
+    # Validate file existence early — one stat() per file answers the
+    # probe and yields the size for the log line; exists() would cost the
+    # same syscall and discard everything but the boolean.
+    for file_path in args.file_path:
+        try:
+            st = os.stat(file_path)
+        except OSError as e:
+            log.error("File not found: %s (%s)", file_path, e.strerror)
+            sys.exit(1)
+        log.info("Studying %s (%s bytes)", file_path, format(st.st_size, ","))
 
     # Initialize study controller
     rag_study = RAGStudy()
@@ -158,23 +233,47 @@ def main():
         sentence_model_name=args.sentence_model_name,
         openai_model_name=args.openai_model_name,
         openai_api_key=args.openai_api_key,  # service will fall back to env if None
+        sentence_fp16=(args.compute_dtype == "fp16"),
+        embed_batch_size=args.embed_batch_size,
     )
     if not ok:
         log.error("Failed to initialize RAG service.")
         sys.exit(2)
 
-    # Run study (ingest)
+    # Run study (ingest); several files go through the service's
+    # concurrent batch path so the model loads once and per-file work
+    # overlaps instead of re-paying startup in a shell loop.
     try:
-        result = rag_study.study_document(args.file_path, args.file_type)
+        if len(args.file_path) == 1:
+            result = rag_study.study_document(args.file_path[0], args.file_type)
+        else:
+            result = rag_study.study_documents(args.file_path, args.file_type)
         if args.json_output:
-            print(json.dumps(result, ensure_ascii=False, indent=2))
+            print(_dumps(result))
         else:
-            print("\n=== Study Result ===")
-            print(json.dumps(result, ensure_ascii=False, indent=2))
-            print("\nTip: use the same embedding when querying this collection.")
-            print(f"Collection: {result.get('collection_name')} | Embedding: {result.get('embedding_method')}")
+            # One buffered write instead of a print per line; for batch
+            # runs the report is emitted with a single syscall.
+            out = (
+                "\n=== Study Result ===\n"
+                f"{_dumps(result)}\n"
+                "\nTip: use the same embedding when querying this collection.\n"
+            )
+            if isinstance(result, dict):
+                out += (
+                    f"Collection: {result.get('collection_name')} | "
+                    f"Embedding: {result.get('embedding_method')}\n"
+                )
+            sys.stdout.write(out)
+            sys.stdout.flush()
+        # Batch mode reports per-file failures as error entries instead of
+        # raising; surface them through the exit code like single-file mode.
+        if isinstance(result, list) and any(
+            isinstance(entry, dict) and entry.get("status") == "error" for entry in result
+        ):
+            log.error("One or more files failed to study.")
+            sys.exit(3)
     except Exception as e:
-        log.exception(f"Study failed: {e}")
+        log.exception("Study failed: %s", e)
         sys.exit(3)
 
 